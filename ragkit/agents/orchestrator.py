@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
 from collections.abc import AsyncIterator, Awaitable
 from typing import Any, TypeVar
@@ -40,6 +41,12 @@ class AgentOrchestrator:
             llm_router.get(config.response_generator.llm),
         )
         self.retrieval = retrieval_engine
+        # Without query rewriting the analysis almost always leaves the search query
+        # unchanged, so retrieval can start on the raw query while the analyzer runs.
+        behavior = config.query_analyzer.behavior
+        self.speculative_retrieval = (
+            behavior.always_retrieve or not behavior.query_rewriting.enabled
+        )
         self.metrics_enabled = metrics_enabled
         self.metrics = metrics_collector or default_metrics
 
@@ -48,6 +55,7 @@ class AgentOrchestrator:
         error: str | None = None
         analysis: QueryAnalysis | None = None
         context: list[RetrievalResult] | None = None
+        speculative = self._start_speculative_retrieval(query)
         try:
             analysis = await _timed_component(
                 self.metrics,
@@ -55,15 +63,7 @@ class AgentOrchestrator:
                 "query_analyzer",
                 self.query_analyzer.analyze(query, history),
             )
-
-            if analysis.needs_retrieval:
-                search_query = analysis.rewritten_query or query
-                context = await _timed_component(
-                    self.metrics,
-                    self.metrics_enabled,
-                    "retrieval",
-                    self.retrieval.retrieve(search_query),
-                )
+            context = await self._retrieve(query, analysis, speculative)
 
             response = await _timed_component(
                 self.metrics,
@@ -77,6 +77,7 @@ class AgentOrchestrator:
             error = str(exc)
             raise
         finally:
+            _discard(speculative)
             if self.metrics_enabled:
                 latency_ms = (time.perf_counter() - start) * 1000
                 intent = analysis.intent if analysis else None
@@ -96,6 +97,7 @@ class AgentOrchestrator:
         analysis: QueryAnalysis | None = None
         context: list[RetrievalResult] | None = None
         response_chunks: list[str] = []
+        speculative = self._start_speculative_retrieval(query)
         try:
             analysis = await _timed_component(
                 self.metrics,
@@ -103,15 +105,7 @@ class AgentOrchestrator:
                 "query_analyzer",
                 self.query_analyzer.analyze(query, history),
             )
-
-            if analysis.needs_retrieval:
-                search_query = analysis.rewritten_query or query
-                context = await _timed_component(
-                    self.metrics,
-                    self.metrics_enabled,
-                    "retrieval",
-                    self.retrieval.retrieve(search_query),
-                )
+            context = await self._retrieve(query, analysis, speculative)
 
             sources: list[str] = []
             if analysis.needs_retrieval and analysis.intent != "out_of_scope":
@@ -151,6 +145,7 @@ class AgentOrchestrator:
             yield {"type": "error", "message": error}
             return
         finally:
+            _discard(speculative)
             if self.metrics_enabled:
                 latency_ms = (time.perf_counter() - start) * 1000
                 intent = analysis.intent if analysis else None
@@ -162,6 +157,47 @@ class AgentOrchestrator:
                     error=error,
                 )
 
+    def _start_speculative_retrieval(self, query: str) -> asyncio.Task | None:
+        if not self.speculative_retrieval:
+            return None
+        return asyncio.create_task(
+            _timed_component(
+                self.metrics,
+                self.metrics_enabled,
+                "retrieval",
+                self.retrieval.retrieve(query),
+            )
+        )
+
+    async def _retrieve(
+        self,
+        query: str,
+        analysis: QueryAnalysis,
+        speculative: asyncio.Task | None,
+    ) -> list[RetrievalResult] | None:
+        if not analysis.needs_retrieval:
+            return None
+        search_query = analysis.rewritten_query or query
+        if speculative is not None and search_query == query:
+            return await speculative
+        return await _timed_component(
+            self.metrics,
+            self.metrics_enabled,
+            "retrieval",
+            self.retrieval.retrieve(search_query),
+        )
+
+
+def _discard(task: asyncio.Task | None) -> None:
+    """Cancel a speculative retrieval whose result is not needed."""
+    if task is None:
+        return
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        # Mark a failure as retrieved so asyncio does not log it.
+        task.exception()
+
 
 async def _timed_component(
     metrics: MetricsCollector,
@@ -173,12 +209,17 @@ async def _timed_component(
         return await coro
     start = time.perf_counter()
     error: str | None = None
+    cancelled = False
     try:
         result = await coro
         return result
+    except asyncio.CancelledError:
+        cancelled = True
+        raise
     except Exception as exc:  # noqa: BLE001
         error = str(exc)
         raise
     finally:
-        latency_ms = (time.perf_counter() - start) * 1000
-        metrics.record_component_call(name, latency_ms, error is None, error)
+        if not cancelled:
+            latency_ms = (time.perf_counter() - start) * 1000
+            metrics.record_component_call(name, latency_ms, error is None, error)
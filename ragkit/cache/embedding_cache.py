@@ -33,4 +33,4 @@ class EmbeddingCache:
 
     @staticmethod
     def _hash_text(text: str) -> str:
-        return hashlib.md5(text.encode("utf-8")).hexdigest()
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
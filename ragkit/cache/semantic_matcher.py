@@ -5,28 +5,31 @@ from __future__ import annotations
 import asyncio
 import time
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
 from typing import cast
 
-from ragkit.config.schema_v2 import CacheConfigV2
-
-
-@dataclass
-class _SemanticEntry:
-    embedding: list[float]
-    expires_at: float | None
+import numpy as np
 
+from ragkit.config.schema_v2 import CacheConfigV2
 
 Embedder = Callable[[list[str]], Awaitable[list[list[float]]] | list[list[float]]]
 
 
 class SemanticMatcher:
-    """Match queries by embedding similarity."""
+    """Match queries by embedding similarity.
+
+    Cached embeddings are L2-normalized once when added and kept as rows of a
+    float32 matrix, so a lookup is a single matrix-vector product. The matrix
+    doubles its capacity when full; only the first ``len(self._keys)`` rows
+    are in use.
+    """
 
     def __init__(self, config: CacheConfigV2, embedder: Embedder) -> None:
         self.config = config
         self.embedder = embedder
-        self._store: dict[str, _SemanticEntry] = {}
+        self._keys: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._matrix: np.ndarray | None = None
+        self._expires_at = np.empty(0)
         self._lock = asyncio.Lock()
 
     async def find(self, query: str) -> str | None:
@@ -34,25 +37,19 @@ class SemanticMatcher:
         if not embedding:
             return None
 
+        vector = _unit_vector(embedding)
         now = time.monotonic()
-        best_key = None
-        best_score = 0.0
         async with self._lock:
-            expired = [
-                key
-                for key, entry in self._store.items()
-                if entry.expires_at and entry.expires_at < now
-            ]
-            for key in expired:
-                self._store.pop(key, None)
-
-            for key, entry in self._store.items():
-                score = _cosine_similarity(embedding, entry.embedding)
-                if score > best_score:
-                    best_score = score
-                    best_key = key
-
-        if best_key and best_score >= self.config.semantic_cache_threshold:
+            self._purge_expired(now)
+            if self._matrix is None or self._matrix.shape[1] != len(vector):
+                return None
+
+            scores = self._matrix[: len(self._keys)] @ vector
+            best = int(scores.argmax())
+            best_key = self._keys[best]
+            best_score = float(scores[best])
+
+        if best_score > 0 and best_score >= self.config.semantic_cache_threshold:
             return best_key
         return None
 
@@ -60,11 +57,63 @@ class SemanticMatcher:
         embedding = await self._embed(query)
         if not embedding:
             return
-        expires_at = None
+        expires_at = np.inf
         if ttl and ttl > 0:
             expires_at = time.monotonic() + ttl
+
+        vector = _unit_vector(embedding)
         async with self._lock:
-            self._store[key] = _SemanticEntry(embedding=embedding, expires_at=expires_at)
+            if self._matrix is not None and self._matrix.shape[1] != len(vector):
+                # A different dimension means a different embedder: old rows can
+                # never match new queries.
+                self._keep(np.zeros(len(self._keys), dtype=bool))
+
+            row = self._rows.get(key)
+            if row is not None:
+                assert self._matrix is not None
+                self._matrix[row] = vector
+                self._expires_at[row] = expires_at
+                return
+
+            row = len(self._keys)
+            if self._matrix is None:
+                self._matrix = np.empty((1, len(vector)), dtype=np.float32)
+                self._expires_at = np.empty(1)
+            elif row == len(self._matrix):
+                self._grow()
+            self._matrix[row] = vector
+            self._expires_at[row] = expires_at
+            self._rows[key] = row
+            self._keys.append(key)
+
+    def _grow(self) -> None:
+        """Double the capacity of the matrix and the expiry array."""
+        assert self._matrix is not None
+        count = len(self._keys)
+        matrix = np.empty((2 * len(self._matrix), self._matrix.shape[1]), dtype=np.float32)
+        matrix[:count] = self._matrix[:count]
+        expires_at = np.empty(len(matrix))
+        expires_at[:count] = self._expires_at[:count]
+        self._matrix, self._expires_at = matrix, expires_at
+
+    def _purge_expired(self, now: float) -> None:
+        alive = self._expires_at[: len(self._keys)] >= now
+        if not alive.all():
+            self._keep(alive)
+
+    def _keep(self, mask: np.ndarray) -> None:
+        """Keep only the entries selected by a boolean mask over the rows in use."""
+        self._keys = [key for key, keep in zip(self._keys, mask, strict=True) if keep]
+        self._rows = {key: row for row, key in enumerate(self._keys)}
+        if not self._keys:
+            self._matrix = None
+            self._expires_at = np.empty(0)
+            return
+        # Compact the kept rows to the front, keeping the capacity.
+        assert self._matrix is not None
+        kept = np.flatnonzero(mask)
+        self._matrix[: len(kept)] = self._matrix[kept]
+        self._expires_at[: len(kept)] = self._expires_at[kept]
 
     async def _embed(self, query: str) -> list[float]:
         result = self.embedder([query])
@@ -76,14 +125,8 @@ class SemanticMatcher:
         return list(result_list[0])
 
 
-def _cosine_similarity(a: list[float], b: list[float]) -> float:
-    if not a or not b:
-        return 0.0
-    if len(a) != len(b):
-        return 0.0
-    dot = sum(x * y for x, y in zip(a, b, strict=False))
-    norm_a = sum(x * x for x in a) ** 0.5
-    norm_b = sum(y * y for y in b) ** 0.5
-    if norm_a == 0 or norm_b == 0:
-        return 0.0
-    return dot / (norm_a * norm_b)
+def _unit_vector(embedding: list[float]) -> np.ndarray:
+    """float32 copy of an embedding scaled to unit length (zero vectors stay zero)."""
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
@@ -12,6 +12,9 @@ from ragkit.config.schema import RAGKitConfig
 from ragkit.config.validators import validate_config
 from ragkit.exceptions import ConfigError
 
+# libyaml's C loader parses ~9x faster; PyYAML builds without it fall back to Python.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ConfigLoader:
     """Load and validate YAML configuration files."""
@@ -43,7 +46,7 @@ class ConfigLoader:
             raise ConfigError(f"Config file not found: {path}")
         try:
             with Path(path).open("r", encoding="utf-8") as handle:
-                data = yaml.safe_load(handle) or {}
+                data = yaml.load(handle, Loader=_YAML_LOADER) or {}
         except yaml.YAMLError as exc:
             raise ConfigError(f"Invalid YAML: {exc}") from exc
         if not isinstance(data, dict):
@@ -152,9 +152,13 @@ def get_profile_for_answers(
     if kb_type not in PROFILES:
         raise ValueError(f"Unknown knowledge base type: {kb_type}")
 
-    import copy
-
-    profile: dict[str, Any] = copy.deepcopy(PROFILES[kb_type])
+    # Profile sections are flat dicts of scalars, so copying each section is
+    # enough to keep the caller's edits out of PROFILES (and ~10x cheaper than
+    # a deepcopy).
+    profile: dict[str, Any] = {
+        key: dict(value) if isinstance(value, dict) else value
+        for key, value in PROFILES[kb_type].items()
+    }
 
     if has_tables:
         profile.setdefault("parsing", {})
@@ -5,7 +5,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import Any, Literal, TypeVar, cast
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -129,6 +129,9 @@ class DocumentParsingConfig(BaseModel):
     min_text_length: int = 50
     max_text_length: int = 1_000_000
     skip_empty_pages: bool = True
+    page_concurrency: int = Field(4, ge=1, le=32)
+    cache_enabled: bool = False
+    cache_dir: str = ".ragkit/parsing_cache"
 
 
 class TextPreprocessingConfig(BaseModel):
@@ -269,6 +272,7 @@ class EmbeddingConfigV2(BaseModel):
     document_instruction_prefix: str | None = None
 
     use_gpu: bool = False
+    torch_dtype: Literal["float32", "float16", "bfloat16"] = "float32"
     num_workers: int = Field(1, ge=1, le=32)
 
 
@@ -284,6 +288,7 @@ class VectorDBConfigV2(BaseModel):
         "weaviate",
         "milvus",
         "faiss",
+        "flat",  # exact NumPy search, see FlatVectorAdapter
     ] = "chromadb"
 
     distance_metric: Literal["cosine", "euclidean", "dot_product", "manhattan"] = "cosine"
@@ -398,7 +403,16 @@ class RerankingConfigV2(BaseModel):
 
     use_gpu: bool = True
     half_precision: bool = False
+    torch_dtype: Literal["float32", "float16", "bfloat16"] = "float32"
+    cpu_threads: int | None = Field(None, ge=1)
     cache_model: bool = True
+    score_cache_size: int = Field(10_000, ge=0)  # (query, document) scores kept; 0 disables
+
+    @model_validator(mode="after")
+    def _check_precision(self) -> RerankingConfigV2:
+        if self.half_precision and self.torch_dtype == "bfloat16":
+            raise ValueError("half_precision (float16) conflicts with torch_dtype='bfloat16'")
+        return self
 
 
 class LLMGenerationConfigV2(BaseModel):
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from ragkit.config.schema import EmbeddingModelConfig
 from ragkit.embedding.base import BaseEmbedder
+from ragkit.embedding.batching import BatchedEmbedder
 from ragkit.embedding.cache import CachedEmbedder, EmbeddingCache
 from ragkit.embedding.providers.cohere import CohereEmbedder
 from ragkit.embedding.providers.litellm import LiteLLMEmbedder
@@ -35,6 +36,7 @@ def create_embedder(config: EmbeddingModelConfig) -> BaseEmbedder:
 
 __all__ = [
     "BaseEmbedder",
+    "BatchedEmbedder",
     "EmbeddingCache",
     "CachedEmbedder",
     "OpenAIEmbedder",
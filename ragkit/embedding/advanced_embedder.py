@@ -32,7 +32,7 @@ class AdvancedEmbedder:
 
     Features:
     - Multi-provider support (OpenAI, Cohere, HuggingFace, etc.)
-    - MD5 cache to avoid re-computation
+    - SHA-256 keyed cache to avoid re-computation
     - Rate limiting (RPM/TPM)
     - Automatic retry with exponential backoff
     - Intelligent batching
@@ -70,7 +70,7 @@ class AdvancedEmbedder:
         Workflow:
         1. Preprocessing (strip, normalize)
         2. Truncation if necessary
-        3. Cache lookup (MD5 hash)
+        3. Cache lookup (SHA-256 hash)
         4. Rate limiting (RPM/TPM)
         5. API call with retry
         6. Post-processing (normalization, reduction, quantization)
@@ -140,6 +140,11 @@ class AdvancedEmbedder:
                         self.cache[key] = new_embeddings[new_idx]
                         new_idx += 1
 
+            # Nothing came from the cache: the new block is already in input order.
+            # Cached rows are views into it, so hand the caller its own copy.
+            if len(texts_to_embed) == len(processed_texts):
+                return new_embeddings.copy() if self.cache is not None else new_embeddings
+
             # Combine with cache
             new_idx = 0
             for i in range(len(embeddings)):
@@ -398,12 +403,12 @@ class AdvancedEmbedder:
         return quantized
 
     def _get_cache_key(self, text: str) -> str:
-        """Generate MD5 cache key for a text.
+        """Generate SHA-256 cache key for a text.
 
         Args:
             text: Text to hash
 
         Returns:
-            MD5 hash (32 hex characters)
+            SHA-256 hash (64 hex characters)
         """
-        return hashlib.md5(text.encode("utf-8")).hexdigest()
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
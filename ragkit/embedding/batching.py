@@ -0,0 +1,46 @@
+"""Dynamic micro-batching for embedders."""
+
+from __future__ import annotations
+
+import asyncio
+
+from ragkit.cache.batch_processor import BatchProcessor
+from ragkit.embedding.base import BaseEmbedder
+
+
+class BatchedEmbedder(BaseEmbedder):
+    """Coalesce concurrent ``embed`` calls into provider-sized batches.
+
+    Texts from every caller are queued and sent upstream together once
+    ``max_batch_size`` texts are waiting or ``max_wait_ms`` has passed since
+    the first one, so many small concurrent requests share one API round trip.
+    Queries go straight to the wrapped embedder, since providers may embed
+    them differently from documents.
+    """
+
+    def __init__(
+        self,
+        embedder: BaseEmbedder,
+        max_batch_size: int = 64,
+        max_wait_ms: int = 5,
+    ):
+        self.embedder = embedder
+        self._processor = BatchProcessor(
+            process_batch_fn=embedder.embed,
+            batch_size=max_batch_size,
+            timeout_ms=max_wait_ms,
+        )
+
+    @property
+    def dimensions(self) -> int | None:
+        return self.embedder.dimensions
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        return list(await asyncio.gather(*(self._processor.process(text) for text in texts)))
+
+    async def embed_query(self, query: str) -> list[float]:
+        return await self.embedder.embed_query(query)
+
+    async def aclose(self) -> None:
+        """Stop the background batching task."""
+        await self._processor.stop()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import os
@@ -79,9 +80,16 @@ class EmbeddingCache:
 
 
 class CachedEmbedder(BaseEmbedder):
+    """Embedder wrapper that serves repeated texts from an ``EmbeddingCache``.
+
+    Concurrent misses on the same text share one upstream call: the first
+    caller registers a future under the text's hash and the others await it.
+    """
+
     def __init__(self, embedder: BaseEmbedder, cache: EmbeddingCache):
         self.embedder = embedder
         self.cache = cache
+        self._inflight: dict[str, asyncio.Future[list[float]]] = {}
 
     @property
     def dimensions(self) -> int | None:
@@ -90,35 +98,99 @@ class CachedEmbedder(BaseEmbedder):
     async def embed(self, texts: list[str]) -> list[list[float]]:
         results: list[list[float]] = []
         missing_texts: list[str] = []
+        missing_keys: list[str] = []
         missing_indices: list[int] = []
+        pending: list[tuple[int, asyncio.Future[list[float]]]] = []
 
         for idx, text in enumerate(texts):
-            cached = await self.cache.get(_hash_text(text))
-            if cached is None:
-                missing_texts.append(text)
-                missing_indices.append(idx)
-                results.append([])
-            else:
-                results.append(cached)
+            key = _hash_text(text)
+            cached = await self.cache.get(key)
+            results.append([] if cached is None else cached)
+            if cached is not None:
+                continue
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                # Being embedded by another call, or earlier in this batch.
+                pending.append((idx, inflight))
+                continue
+            self._inflight[key] = asyncio.get_running_loop().create_future()
+            missing_texts.append(text)
+            missing_keys.append(key)
+            missing_indices.append(idx)
 
         if missing_texts:
-            new_embeddings = await self.embedder.embed(missing_texts)
-            for offset, embedding in enumerate(new_embeddings):
-                text = missing_texts[offset]
-                index = missing_indices[offset]
-                await self.cache.set(_hash_text(text), embedding)
+            try:
+                new_embeddings = await self.embedder.embed(missing_texts)
+                for key, index, embedding in zip(
+                    missing_keys, missing_indices, new_embeddings, strict=False
+                ):
+                    await self.cache.set(key, embedding)
+                    results[index] = embedding
+                    self._inflight[key].set_result(embedding)
+            except BaseException as exc:
+                self._release(missing_keys, exc)
+                raise
+            self._release(missing_keys)
+
+        abandoned: list[int] = []
+        for index, future in pending:
+            try:
+                results[index] = await asyncio.shield(future)
+            except _OwnerCancelled:
+                abandoned.append(index)
+        if abandoned:
+            # The calls embedding these texts were cancelled; embed them ourselves.
+            embeddings = await self.embed([texts[index] for index in abandoned])
+            for index, embedding in zip(abandoned, embeddings, strict=True):
                 results[index] = embedding
 
         return results
 
     async def embed_query(self, query: str) -> list[float]:
-        cached = await self.cache.get(_hash_text(query))
+        key = _hash_text(query)
+        cached = await self.cache.get(key)
         if cached is not None:
             return cached
-        embedding = await self.embedder.embed_query(query)
-        await self.cache.set(_hash_text(query), embedding)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except _OwnerCancelled:
+                # The call embedding this query was cancelled; start over.
+                return await self.embed_query(query)
+
+        self._inflight[key] = asyncio.get_running_loop().create_future()
+        try:
+            embedding = await self.embedder.embed_query(query)
+            await self.cache.set(key, embedding)
+            self._inflight[key].set_result(embedding)
+        except BaseException as exc:
+            self._release([key], exc)
+            raise
+        self._release([key])
         return embedding
 
+    def _release(self, keys: list[str], error: BaseException | None = None) -> None:
+        """Drop in-flight futures, failing any that were never resolved.
+
+        Cancellation belongs to the caller that owned the upstream call, so
+        waiters get ``_OwnerCancelled`` and embed the text themselves instead
+        of being cancelled too.
+        """
+        if isinstance(error, asyncio.CancelledError):
+            error = _OwnerCancelled()
+        for key in keys:
+            future = self._inflight.pop(key, None)
+            if future is None or future.done():
+                continue
+            future.set_exception(error or RuntimeError("Embedder returned too few embeddings."))
+            # Waiters re-raise or handle the error; don't also log it as never retrieved.
+            future.exception()
+
+
+class _OwnerCancelled(Exception):
+    """The call embedding an in-flight text was cancelled before it finished."""
+
 
 def _hash_text(text: str) -> str:
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
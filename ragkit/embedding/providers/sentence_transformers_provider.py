@@ -3,12 +3,29 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import logging
 
 import numpy as np
 import torch
 from sentence_transformers import SentenceTransformer
 
 from ragkit.config.schema_v2 import EmbeddingConfigV2
+from ragkit.utils.locks import KeyedLocks
+
+logger = logging.getLogger(__name__)
+
+# Only concurrent loads of the same (model, device, dtype) wait for each other
+_MODEL_LOCKS = KeyedLocks()
+
+
+@functools.lru_cache(maxsize=8)
+def _load_model(model_name: str, device: str, dtype_name: str) -> SentenceTransformer:
+    """Load a SentenceTransformer once per (model, device, dtype) for the process."""
+    model = SentenceTransformer(model_name, device=device)
+    if dtype_name != "float32":
+        model.to(getattr(torch, dtype_name))
+    return model
 
 
 class SentenceTransformersProvider:
@@ -22,17 +39,22 @@ class SentenceTransformersProvider:
         """
         self.config = config
 
-        # Load model
         device = "cuda" if config.use_gpu and torch.cuda.is_available() else "cpu"
 
-        self.model = SentenceTransformer(
-            config.model,
-            device=device,
-        )
-
-        # Half precision if configured (GPU only)
-        if config.use_gpu and hasattr(self.model, "half"):
-            self.model.half()
+        # Reduced-precision weights. The GPU keeps the legacy float16 default;
+        # an explicit torch_dtype overrides it. float16 is not applied on CPU.
+        dtype_name = config.torch_dtype
+        if dtype_name == "float32" and device == "cuda":
+            dtype_name = "float16"
+        if dtype_name == "float16" and device != "cuda":
+            logger.warning("float16 weights require CUDA; keeping float32 on %s", device)
+            dtype_name = "float32"
+        self._dtype_name = dtype_name
+
+        # Load model, shared with other providers using the same settings
+        key = (config.model, device, dtype_name)
+        with _MODEL_LOCKS(key):
+            self.model = _load_model(*key)
 
     async def embed(self, texts: list[str]) -> np.ndarray:
         """Embed a list of texts locally.
@@ -46,15 +68,29 @@ class SentenceTransformersProvider:
         # SentenceTransformers encode is synchronous, run in executor
         loop = asyncio.get_event_loop()
 
-        embeddings = await loop.run_in_executor(
-            None,
-            lambda: self.model.encode(
+        embeddings = await loop.run_in_executor(None, self._encode, texts)
+
+        return embeddings
+
+    def _encode(self, texts: list[str]) -> np.ndarray:
+        """Encode texts, upcasting reduced-precision outputs to float32."""
+        if self._dtype_name == "float32":
+            return self.model.encode(
                 texts,
                 batch_size=self.config.batch_size,
                 show_progress_bar=False,
                 convert_to_numpy=True,
                 normalize_embeddings=self.config.normalize_embeddings,
-            ),
-        )
-
-        return embeddings
+            )
+
+        # NumPy has no bfloat16: take the tensor, upcast, then normalize in float32.
+        embeddings = self.model.encode(
+            texts,
+            batch_size=self.config.batch_size,
+            show_progress_bar=False,
+            convert_to_tensor=True,
+            normalize_embeddings=False,
+        ).float()
+        if self.config.normalize_embeddings:
+            embeddings = torch.nn.functional.normalize(embeddings, p=2, dim=-1)
+        return embeddings.cpu().numpy()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from pathlib import Path
 
@@ -12,15 +13,31 @@ from ragkit.models import Chunk
 _TOKEN_RE = re.compile(r"\S+")
 
 
-def _tokenize(text: str) -> tuple[list[int] | list[str], object | None]:
+@functools.lru_cache(maxsize=1)
+def _encoding() -> object | None:
+    """cl100k_base tiktoken encoding, or None when tiktoken or its data is unavailable.
+
+    Resolved once per process: a failed lookup (ex: no network to fetch the
+    BPE file) is not retried for every document.
+    """
     try:
         import tiktoken
     except Exception:
+        return None
+
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def _tokenize(text: str) -> tuple[list[int] | list[str], object | None]:
+    encoding = _encoding()
+    if encoding is None:
         return _TOKEN_RE.findall(text), None
 
     try:
-        encoding = tiktoken.get_encoding("cl100k_base")
-        return encoding.encode(text), encoding
+        return encoding.encode(text), encoding  # type: ignore[attr-defined]
     except Exception:
         return _TOKEN_RE.findall(text), None
 
@@ -28,6 +45,8 @@ def _tokenize(text: str) -> tuple[list[int] | list[str], object | None]:
 def _detokenize(tokens: list[int] | list[str], encoding: object | None) -> str:
     if encoding is not None and tokens and isinstance(tokens[0], int):
         return encoding.decode(tokens)  # type: ignore[attr-defined]
+    if tokens and isinstance(tokens[0], str):
+        return " ".join(tokens)  # type: ignore[arg-type]
     return " ".join(str(token) for token in tokens)
 
 
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import inspect
-import math
 import re
 from collections.abc import Iterable
 from pathlib import Path
 
+import numpy as np
+
 from ragkit.config.schema import SemanticChunkingConfig
 from ragkit.ingestion.chunkers.base import BaseChunker
 from ragkit.ingestion.chunkers.fixed import _detokenize, _tokenize
@@ -29,13 +30,16 @@ def _document_id(document: ParsedDocument) -> str:
     return "document"
 
 
-def _cosine_similarity(vec_a: list[float], vec_b: list[float]) -> float:
-    dot = sum(a * b for a, b in zip(vec_a, vec_b, strict=False))
-    norm_a = math.sqrt(sum(a * a for a in vec_a))
-    norm_b = math.sqrt(sum(b * b for b in vec_b))
-    if norm_a == 0 or norm_b == 0:
-        return 0.0
-    return dot / (norm_a * norm_b)
+def _adjacent_similarities(embeddings: list[list[float]]) -> list[float]:
+    """Cosine similarity of each embedding with the next one (0.0 for zero vectors)."""
+    matrix = np.asarray(embeddings, dtype=np.float64)
+    if len(matrix) < 2:
+        return []
+    norms = np.linalg.norm(matrix, axis=1)
+    dots = np.einsum("ij,ij->i", matrix[:-1], matrix[1:])
+    denominators = norms[:-1] * norms[1:]
+    similarities = np.divide(dots, denominators, out=np.zeros_like(dots), where=denominators != 0)
+    return similarities.tolist()
 
 
 def _maybe_embed_sync(embedder: object, texts: Iterable[str]) -> list[list[float]] | None:
@@ -95,6 +99,7 @@ class SemanticChunker(BaseChunker):
     ) -> list[Chunk]:
         if embeddings is not None and len(embeddings) != len(sentences):
             embeddings = None
+        similarities = _adjacent_similarities(embeddings) if embeddings is not None else None
 
         doc_id = _document_id(document)
         chunks: list[Chunk] = []
@@ -111,8 +116,8 @@ class SemanticChunker(BaseChunker):
             should_split = False
             if current_tokens >= self.max_size:
                 should_split = True
-            elif embeddings is not None and idx < len(sentences) - 1:
-                similarity = _cosine_similarity(embeddings[idx], embeddings[idx + 1])
+            elif similarities is not None and idx < len(sentences) - 1:
+                similarity = similarities[idx]
                 if similarity < self.similarity_threshold and current_tokens >= self.min_size:
                     should_split = True
 
@@ -17,7 +17,10 @@ class DocumentDeduplicator:
     * **exact** – SHA-256 hash of the normalised content.
     * **fuzzy** – SequenceMatcher ratio against previously registered texts
       (only practical for small corpora; for large-scale fuzzy dedup consider
-      SimHash / MinHash which can be added later).
+      SimHash / MinHash which can be added later). Each registered text keeps
+      its own matcher, so its index is built once, and the cheap
+      ``real_quick_ratio`` / ``quick_ratio`` upper bounds skip most full
+      ``ratio`` computations.
     """
 
     def __init__(
@@ -29,6 +32,10 @@ class DocumentDeduplicator:
         self.threshold = threshold
         self._hashes: set[str] = set()
         self._texts: list[str] = []  # only populated for fuzzy strategy
+        self._matchers: list[SequenceMatcher] = []  # one per entry of _texts
+        # (content, hash) of the last is_duplicate() check, so the usual
+        # is_duplicate() -> register() sequence hashes each document once
+        self._last_hash: tuple[str, str] | None = None
 
     def is_duplicate(self, content: str) -> bool:
         """Return *True* if *content* has already been registered."""
@@ -37,12 +44,18 @@ class DocumentDeduplicator:
 
         if self.strategy == "exact":
             h = self._exact_hash(content)
+            self._last_hash = (content, h)
             return h in self._hashes
 
         if self.strategy == "fuzzy":
-            for existing in self._texts:
-                ratio = SequenceMatcher(None, content, existing).ratio()
-                if ratio >= self.threshold:
+            threshold = self.threshold
+            for matcher in self._matchers:
+                matcher.set_seq1(content)
+                if (
+                    matcher.real_quick_ratio() >= threshold
+                    and matcher.quick_ratio() >= threshold
+                    and matcher.ratio() >= threshold
+                ):
                     return True
             return False
 
@@ -52,9 +65,11 @@ class DocumentDeduplicator:
     def register(self, content: str) -> None:
         """Add *content* to the known-document registry."""
         if self.strategy == "exact":
-            self._hashes.add(self._exact_hash(content))
+            last = self._last_hash
+            self._hashes.add(last[1] if last and last[0] is content else self._exact_hash(content))
         elif self.strategy == "fuzzy":
             self._texts.append(content)
+            self._matchers.append(SequenceMatcher(None, "", content))
 
     @staticmethod
     def _exact_hash(content: str) -> str:
@@ -66,3 +81,5 @@ class DocumentDeduplicator:
         """Clear the deduplication registry."""
         self._hashes.clear()
         self._texts.clear()
+        self._matchers.clear()
+        self._last_hash = None
@@ -14,6 +14,10 @@ from ragkit.ingestion.sources.base import RawDocument
 
 logger = logging.getLogger(__name__)
 
+# langdetect's cost grows with the text (up to 10k chars); a prefix of this
+# size is enough to identify the language of a document.
+_LANGUAGE_SAMPLE_CHARS = 2000
+
 
 class MetadataExtractor:
     """Build a :class:`DocumentMetadata` by inspecting a raw and parsed document."""
@@ -121,7 +125,7 @@ class MetadataExtractor:
         try:
             from langdetect import detect
 
-            return detect(text)
+            return detect(text[:_LANGUAGE_SAMPLE_CHARS])
         except Exception:  # noqa: BLE001
             logger.debug("Language detection failed, returning None")
             return None
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
-from dataclasses import dataclass, field
+import os
+import tempfile
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -14,6 +19,10 @@ from ragkit.utils.ocr import OCREngine
 
 logger = logging.getLogger(__name__)
 
+# Bump when the structure of ParsedDocument changes so stale cache entries are ignored.
+_CACHE_VERSION = "1"
+_CACHE_EXCLUDED_FIELDS = {"cache_enabled", "cache_dir", "page_concurrency"}
+
 
 @dataclass
 class ParsedDocument:
@@ -46,16 +55,25 @@ class AdvancedPDFParser:
         except Exception as exc:  # noqa: BLE001
             raise RuntimeError("pdfplumber is required for AdvancedPDFParser") from exc
 
+        cache_key: str | None = None
+        if self.config.cache_enabled:
+            cache_key = self._cache_key(file_path)
+            cached = self._load_cached(cache_key)
+            if cached is not None:
+                logger.info("Using cached parse for PDF: %s", file_path)
+                cached.metadata["source_file"] = str(file_path)
+                return cached
+
         logger.info("Parsing PDF: %s", file_path)
 
         pages: list[dict[str, Any]] = []
         total_text_extracted = 0
 
         with pdfplumber.open(file_path) as pdf:
-            for page_num, page in enumerate(pdf.pages, start=1):
-                logger.debug("Processing page %s/%s", page_num, len(pdf.pages))
-                page_data = await self._parse_page(page, page_num)
+            parsed_pages = await self._parse_pages(pdf.pages)
 
+            for page_data in parsed_pages:
+                page_num = page_data["page_number"]
                 if (
                     self.config.skip_empty_pages
                     and len(page_data["text"].strip()) < self.config.min_text_length
@@ -79,10 +97,94 @@ class AdvancedPDFParser:
 
         logger.info("PDF parsed: %s pages, %s chars", len(pages), total_text_extracted)
 
-        return ParsedDocument(content=full_content, metadata=metadata, pages=pages)
+        parsed = ParsedDocument(content=full_content, metadata=metadata, pages=pages)
+        if cache_key is not None:
+            self._store_cached(cache_key, parsed)
+        return parsed
+
+    def _cache_key(self, file_path: Path) -> str:
+        """Hash the file content together with the settings that shape the parse."""
+        digest = hashlib.sha256()
+        with file_path.open("rb") as handle:
+            for block in iter(lambda: handle.read(1 << 20), b""):
+                digest.update(block)
+        settings = self.config.model_dump_json(exclude=_CACHE_EXCLUDED_FIELDS)
+        digest.update(settings.encode("utf-8"))
+        return f"{digest.hexdigest()}-{_CACHE_VERSION}"
+
+    def _load_cached(self, cache_key: str) -> ParsedDocument | None:
+        path = Path(self.config.cache_dir) / f"{cache_key}.json"
+        if not path.exists():
+            return None
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+            return ParsedDocument(
+                content=raw["content"],
+                metadata=raw["metadata"],
+                pages=raw.get("pages", []),
+            )
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("Ignoring unreadable parse cache entry %s: %s", path, exc)
+            return None
+
+    def _store_cached(self, cache_key: str, parsed: ParsedDocument) -> None:
+        try:
+            data = json.dumps(asdict(parsed))
+        except (TypeError, ValueError) as exc:
+            logger.debug("Parsed document is not cacheable: %s", exc)
+            return
+
+        cache_dir = Path(self.config.cache_dir)
+        tmp_name = None
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=cache_dir,
+                delete=False,
+            ) as handle:
+                handle.write(data)
+                tmp_name = handle.name
+            os.replace(tmp_name, cache_dir / f"{cache_key}.json")
+        except OSError as exc:
+            logger.warning("Failed to write parse cache entry: %s", exc)
+        finally:
+            if tmp_name and os.path.exists(tmp_name):
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+
+    async def _parse_pages(self, pdf_pages: list[Any]) -> list[dict[str, Any]]:
+        """Parse pages concurrently, capped by ``page_concurrency``.
+
+        Pages are independent, so OCR of one page can overlap with extraction of
+        the others. If any page fails, the remaining tasks are cancelled and
+        awaited before the error propagates, so none of them touches the PDF
+        after the caller closes it.
+        """
+        semaphore = asyncio.Semaphore(self.config.page_concurrency)
+
+        async def _run(page: Any, page_num: int) -> dict[str, Any]:
+            async with semaphore:
+                return await self._parse_page(page, page_num)
+
+        tasks = [
+            asyncio.ensure_future(_run(page, page_num))
+            for page_num, page in enumerate(pdf_pages, start=1)
+        ]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
     async def _parse_page(self, page: Any, page_num: int) -> dict[str, Any]:
         """Parse a single PDF page."""
+        logger.debug("Processing page %s", page_num)
         text = page.extract_text() or ""
 
         if (not text or len(text.strip()) < 10) and self.config.ocr_enabled:
@@ -98,9 +200,12 @@ class AdvancedPDFParser:
             images = await self._image_processor.extract_images(page, page_num)
 
         if self.config.image_captioning_enabled and images:
-            for img in images:
-                if img.get("data"):
-                    img["caption"] = await self._image_processor.generate_caption(img["data"])
+            with_data = [img for img in images if img.get("data")]
+            captions = await self._image_processor.generate_captions(
+                [img["data"] for img in with_data]
+            )
+            for img, caption in zip(with_data, captions, strict=False):
+                img["caption"] = caption
 
         if self.config.footer_removal:
             text = self._remove_footer(text)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import logging
 from typing import Any
 
@@ -15,8 +17,20 @@ class ImageProcessor:
 
     def __init__(self, config: DocumentParsingConfig) -> None:
         self.config = config
-        self._caption_model: Any | None = None
-        self._caption_processor: Any | None = None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _load_blip(model_name: str) -> tuple[Any, Any]:
+        """Load and cache a BLIP processor/model pair shared by all instances.
+
+        BLIP checkpoints are several hundred MB, so they are loaded once per
+        process per model name instead of once per image or per parser.
+        """
+        from transformers import BlipForConditionalGeneration, BlipProcessor
+
+        processor = BlipProcessor.from_pretrained(model_name)
+        model = BlipForConditionalGeneration.from_pretrained(model_name)
+        return processor, model
 
     async def extract_images(self, page: Any, page_num: int) -> list[dict[str, Any]]:
         """Extract images from a pdfplumber page.
@@ -50,20 +64,11 @@ class ImageProcessor:
         if not image_data:
             return ""
 
-        if self._caption_model is None or self._caption_processor is None:
-            try:
-                from transformers import BlipForConditionalGeneration, BlipProcessor
-            except Exception as exc:  # noqa: BLE001
-                logger.warning("Image captioning dependencies missing: %s", exc)
-                return ""
-
-            model_name = self.config.image_captioning_model or "blip-base"
-            self._caption_processor = BlipProcessor.from_pretrained(model_name)
-            self._caption_model = BlipForConditionalGeneration.from_pretrained(model_name)
-
-        processor = self._caption_processor
-        model = self._caption_model
-        if processor is None or model is None:
+        model_name = self.config.image_captioning_model or "blip-base"
+        try:
+            processor, model = self._load_blip(model_name)
+        except ImportError as exc:
+            logger.warning("Image captioning dependencies missing: %s", exc)
             return ""
 
         try:
@@ -81,6 +86,68 @@ class ImageProcessor:
             return ""
 
         inputs = processor(image, return_tensors="pt")
-        output = model.generate(**inputs, max_new_tokens=30)
+        with _inference_mode():
+            output = model.generate(**inputs, max_new_tokens=30)
         caption = processor.decode(output[0], skip_special_tokens=True)
         return caption
+
+    async def generate_captions(self, images: list[bytes]) -> list[str]:
+        """Generate captions for several images with a single model forward.
+
+        Images that are empty or cannot be decoded get an empty caption, so the
+        result is always aligned with ``images``.
+        """
+        if len(images) <= 1:
+            return [await self.generate_caption(data) for data in images]
+
+        captions = [""] * len(images)
+        if not any(images):
+            return captions
+
+        model_name = self.config.image_captioning_model or "blip-base"
+        try:
+            processor, model = self._load_blip(model_name)
+        except ImportError as exc:
+            logger.warning("Image captioning dependencies missing: %s", exc)
+            return captions
+
+        try:
+            import io
+
+            from PIL import Image
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Pillow not available for captioning: %s", exc)
+            return captions
+
+        positions: list[int] = []
+        decoded: list[Any] = []
+        for idx, image_data in enumerate(images):
+            if not image_data:
+                continue
+            try:
+                decoded.append(Image.open(io.BytesIO(image_data)).convert("RGB"))
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Failed to load image %s for captioning: %s", idx, exc)
+                continue
+            positions.append(idx)
+
+        if not decoded:
+            return captions
+
+        inputs = processor(images=decoded, return_tensors="pt")
+        with _inference_mode():
+            output = model.generate(**inputs, max_new_tokens=30)
+        for idx, caption in zip(
+            positions, processor.batch_decode(output, skip_special_tokens=True), strict=False
+        ):
+            captions[idx] = caption
+        return captions
+
+
+def _inference_mode() -> contextlib.AbstractContextManager[Any]:
+    """Return ``torch.inference_mode()`` when torch is available."""
+    try:
+        import torch
+    except Exception:  # noqa: BLE001
+        return contextlib.nullcontext()
+    return torch.inference_mode()
@@ -8,7 +8,9 @@ from ragkit.config.schema import ParsingConfig
 from ragkit.ingestion.parsers.base import BaseParser, DocumentSection, ParsedDocument
 from ragkit.ingestion.sources.base import RawDocument
 
-_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)$")
+# Anchored on a literal "\n" rather than MULTILINE "^" so the regex engine can
+# jump between candidate lines; [^\S\n] keeps the match on one line.
+_HEADING_RE = re.compile(r"\n(#{1,6})[^\S\n]+(.*)")
 
 
 def _ensure_text(content: bytes | str) -> str:
@@ -26,41 +28,29 @@ class MarkdownParser(BaseParser):
 
     async def parse(self, raw_doc: RawDocument) -> ParsedDocument:
         text = _ensure_text(raw_doc.content)
-        lines = text.splitlines()
+        # Same line boundaries as str.splitlines, each preceded by "\n"
+        body = "\n" + "\n".join(text.splitlines())
 
         sections: list[DocumentSection] = []
-        current_title: str | None = None
-        current_level: int | None = None
-        buffer: list[str] = []
-
-        def flush_section() -> None:
-            nonlocal buffer, current_title, current_level
-            if not buffer and current_title is None:
-                return
-            content = "\n".join(buffer).strip()
-            if content or current_title:
-                sections.append(
-                    DocumentSection(
-                        title=current_title,
-                        level=current_level,
-                        content=content,
-                        metadata={},
-                    )
-                )
-            buffer = []
-
-        for line in lines:
-            match = _HEADING_RE.match(line)
-            if match:
-                flush_section()
-                hashes, title = match.groups()
-                current_title = title.strip()
-                current_level = len(hashes)
-            else:
-                buffer.append(line)
-
-        flush_section()
+        title: str | None = None
+        level: int | None = None
+        position = 0
+        for match in _HEADING_RE.finditer(body):
+            _append_section(sections, title, level, body[position : match.start()])
+            hashes, heading = match.groups()
+            title = heading.strip()
+            level = len(hashes)
+            position = match.end()
+        _append_section(sections, title, level, body[position:])
 
         metadata = dict(raw_doc.metadata)
         metadata.setdefault("file_type", "md")
         return ParsedDocument(content=text, metadata=metadata, structure=sections or None)
+
+
+def _append_section(
+    sections: list[DocumentSection], title: str | None, level: int | None, text: str
+) -> None:
+    content = text.strip()
+    if content or title:
+        sections.append(DocumentSection(title=title, level=level, content=content, metadata={}))
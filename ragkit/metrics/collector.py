@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import json
+import os
 import sqlite3
+import threading
 from collections.abc import Iterator
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
@@ -24,11 +26,52 @@ class MetricsCollector:
 
     def __init__(self, db_path: Path | None = None) -> None:
         self.db_path = db_path or Path(".ragkit") / "metrics.db"
-        self._init_db()
-
-    def _init_db(self) -> None:
+        # One connection per process, opened on first use so that importing the
+        # module-level collector touches no files. Reopening it per call costs
+        # more than the write itself, and in WAL mode closing the last connection
+        # forces a checkpoint. Callers may record from worker threads.
+        self._conn: sqlite3.Connection | None = None
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Run a transaction on the shared connection (commits on success)."""
+        self._drop_if_forked()
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._open()
+            with self._conn:
+                yield self._conn
+
+    def close(self) -> None:
+        """Close the connection; the next call reopens it."""
+        self._drop_if_forked()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _drop_if_forked(self) -> None:
+        if self._pid != os.getpid():
+            # The parent's connection (and possibly its held lock) came along
+            # with the fork; an SQLite connection must not be used across fork.
+            self._conn = None
+            self._pid = os.getpid()
+            self._lock = threading.Lock()
+
+    def _open(self) -> sqlite3.Connection:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        with sqlite3.connect(self.db_path) as conn:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._init_db(conn)
+        return conn
+
+    def _init_db(self, conn: sqlite3.Connection) -> None:
+        # WAL lets readers and the writer run concurrently; with it, NORMAL only
+        # syncs at checkpoints instead of on every commit.
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with conn:
             conn.executescript(
                 """
                 CREATE TABLE IF NOT EXISTS metrics (
@@ -52,6 +95,10 @@ class MetricsCollector:
                     timestamp TEXT NOT NULL
                 );
 
+                -- Covers the period filter and every column get_summary reads.
+                CREATE INDEX IF NOT EXISTS idx_query_logs_ts
+                ON query_logs(timestamp, intent, success, latency_ms);
+
                 CREATE TABLE IF NOT EXISTS component_logs (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     component TEXT NOT NULL,
@@ -61,6 +108,9 @@ class MetricsCollector:
                     timestamp TEXT NOT NULL
                 );
 
+                CREATE INDEX IF NOT EXISTS idx_component_logs_ts
+                ON component_logs(timestamp, component, success, latency_ms);
+
                 CREATE TABLE IF NOT EXISTS ingestion_logs (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     documents_loaded INTEGER NOT NULL,
@@ -80,7 +130,7 @@ class MetricsCollector:
         intent: str | None = None,
         error: str | None = None,
     ) -> None:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute(
                 """
                 INSERT INTO query_logs (query, intent, latency_ms, success, error, timestamp)
@@ -105,7 +155,7 @@ class MetricsCollector:
         success: bool,
         error: str | None = None,
     ) -> None:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute(
                 """
                 INSERT INTO component_logs (component, latency_ms, success, error, timestamp)
@@ -131,7 +181,7 @@ class MetricsCollector:
         duration = float(getattr(stats, "duration_seconds", 0.0))
         errors = int(getattr(stats, "errors", 0))
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute(
                 """
                 INSERT INTO ingestion_logs (
@@ -167,19 +217,40 @@ class MetricsCollector:
 
     def get_timeseries(self, metric: str, period: str, interval: str = "1h") -> list[MetricPoint]:
         start = _period_start(period)
-        interval_delta = _parse_interval(interval)
-        rows = self._fetch_metric_rows(metric, start)
-        buckets: dict[datetime, float] = {}
-        for ts, value in rows:
-            bucket = _floor_time(ts, interval_delta)
-            buckets[bucket] = buckets.get(bucket, 0.0) + float(value)
+        seconds = int(_parse_interval(interval).total_seconds())
+        if seconds <= 0:
+            # No bucketing: sum values that share a timestamp.
+            with self._connect() as conn:
+                rows = conn.execute(
+                    """
+                    SELECT timestamp, SUM(value)
+                    FROM metrics
+                    WHERE name = ? AND timestamp >= ?
+                    GROUP BY timestamp
+                    """,
+                    (metric, start.isoformat()),
+                ).fetchall()
+            points = [(datetime.fromisoformat(ts), float(value)) for ts, value in rows]
+        else:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    """
+                    SELECT CAST(strftime('%s', timestamp) AS INTEGER) / ? * ? AS bucket,
+                           SUM(value)
+                    FROM metrics
+                    WHERE name = ? AND timestamp >= ?
+                    GROUP BY bucket
+                    """,
+                    (seconds, seconds, metric, start.isoformat()),
+                ).fetchall()
+            points = [(datetime.fromtimestamp(bucket), float(value)) for bucket, value in rows]
         return [
             MetricPoint(timestamp=bucket, value=value)
-            for bucket, value in sorted(buckets.items(), key=lambda item: item[0])
+            for bucket, value in sorted(points, key=lambda item: item[0])
         ]
 
     def get_query_logs(self, limit: int = 100, offset: int = 0) -> list[dict[str, Any]]:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             rows = conn.execute(
                 """
                 SELECT query, intent, latency_ms, success, error, timestamp
@@ -218,105 +289,109 @@ class MetricsCollector:
             ),
         )
 
-    def _fetch_metric_rows(self, name: str, start: datetime) -> list[tuple[datetime, float]]:
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute(
-                "SELECT timestamp, value FROM metrics WHERE name = ? AND timestamp >= ?",
-                (name, start.isoformat()),
-            ).fetchall()
-        parsed: list[tuple[datetime, float]] = []
-        for ts, value in rows:
-            parsed.append((datetime.fromisoformat(ts), float(value)))
-        return parsed
-
     def _query_metrics(self, start: datetime) -> QueryMetrics:
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute(
+        with self._connect() as conn:
+            by_intent_rows = conn.execute(
                 """
-                SELECT intent, latency_ms, success
+                SELECT intent, COUNT(*), SUM(success = 1), SUM(latency_ms)
                 FROM query_logs
                 WHERE timestamp >= ?
+                GROUP BY intent
                 """,
                 (start.isoformat(),),
             ).fetchall()
-        total = len(rows)
-        if total == 0:
-            return QueryMetrics()
-        latencies = [float(row[1]) for row in rows]
-        success = sum(1 for row in rows if row[2] == 1)
-        failed = total - success
-        by_intent: dict[str, int] = {}
-        for intent, _, _ in rows:
-            if intent:
-                by_intent[intent] = by_intent.get(intent, 0) + 1
+            if not by_intent_rows:
+                return QueryMetrics()
+            # Percentiles need every latency; let SQLite sort them.
+            latencies = [
+                float(row[0])
+                for row in conn.execute(
+                    """
+                    SELECT latency_ms
+                    FROM query_logs
+                    WHERE timestamp >= ?
+                    ORDER BY latency_ms
+                    """,
+                    (start.isoformat(),),
+                )
+            ]
+        total = sum(int(row[1]) for row in by_intent_rows)
+        success = sum(int(row[2]) for row in by_intent_rows)
+        by_intent = {intent: int(count) for intent, count, _, _ in by_intent_rows if intent}
         return QueryMetrics(
             total=total,
             success=success,
-            failed=failed,
-            avg_latency_ms=_average(latencies),
+            failed=total - success,
+            avg_latency_ms=sum(float(row[3]) for row in by_intent_rows) / total,
             p95_latency_ms=_percentile(latencies, 95),
             p99_latency_ms=_percentile(latencies, 99),
             by_intent=by_intent,
         )
 
     def _ingestion_metrics(self, start: datetime) -> IngestionMetrics:
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute(
+        with self._connect() as conn:
+            row = conn.execute(
                 """
-                SELECT documents_loaded, chunks_stored, duration_seconds, errors, timestamp
+                SELECT COUNT(*),
+                       SUM(documents_loaded),
+                       SUM(chunks_stored),
+                       AVG(duration_seconds),
+                       SUM(errors),
+                       MAX(timestamp)
                 FROM ingestion_logs
                 WHERE timestamp >= ?
                 """,
                 (start.isoformat(),),
-            ).fetchall()
-        if not rows:
+            ).fetchone()
+        total_runs, documents, chunks, avg_duration, errors, last_run = row
+        if not total_runs:
             return IngestionMetrics()
-        total_runs = len(rows)
-        total_documents = sum(int(row[0]) for row in rows)
-        total_chunks = sum(int(row[1]) for row in rows)
-        durations = [float(row[2]) for row in rows]
-        errors = sum(int(row[3]) for row in rows)
-        last_run = max(datetime.fromisoformat(row[4]) for row in rows)
+        # Timestamps are all UTC isoformat strings, so the textual MAX is the latest.
         return IngestionMetrics(
-            total_runs=total_runs,
-            total_documents=total_documents,
-            total_chunks=total_chunks,
-            avg_duration_seconds=_average(durations),
-            last_run=last_run,
-            errors=errors,
+            total_runs=int(total_runs),
+            total_documents=int(documents),
+            total_chunks=int(chunks),
+            avg_duration_seconds=float(avg_duration),
+            last_run=datetime.fromisoformat(last_run),
+            errors=int(errors),
         )
 
     def _component_metrics(self, start: datetime) -> dict[str, ComponentMetrics]:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             rows = conn.execute(
                 """
-                SELECT component, latency_ms, success, error
+                SELECT component,
+                       COUNT(*),
+                       SUM(success = 0),
+                       AVG(latency_ms),
+                       MAX(CASE WHEN success = 0 THEN id END)
                 FROM component_logs
                 WHERE timestamp >= ?
+                GROUP BY component
                 """,
                 (start.isoformat(),),
             ).fetchall()
-        aggregated: dict[str, dict[str, Any]] = {}
-        for component, latency, success, error in rows:
-            entry = aggregated.setdefault(
-                component,
-                {"latencies": [], "calls": 0, "errors": 0, "last_error": None},
+            last_failures = [row[4] for row in rows if row[4] is not None]
+            last_errors = dict(
+                conn.execute(
+                    f"""
+                    SELECT id, error
+                    FROM component_logs
+                    WHERE id IN ({", ".join("?" * len(last_failures))})
+                    """,
+                    last_failures,
+                ).fetchall()
             )
-            entry["latencies"].append(float(latency))
-            entry["calls"] += 1
-            if success == 0:
-                entry["errors"] += 1
-                entry["last_error"] = error
-        output: dict[str, ComponentMetrics] = {}
-        for component, data in aggregated.items():
-            output[component] = ComponentMetrics(
+        return {
+            component: ComponentMetrics(
                 name=component,
-                calls=data["calls"],
-                errors=data["errors"],
-                avg_latency_ms=_average(data["latencies"]),
-                last_error=data["last_error"],
+                calls=int(calls),
+                errors=int(errors),
+                avg_latency_ms=float(avg_latency),
+                last_error=last_errors.get(last_failure),
             )
-        return output
+            for component, calls, errors, avg_latency, last_failure in rows
+        }
 
 
 @contextmanager
@@ -358,19 +433,6 @@ def _split_period(value: str) -> tuple[int, str]:
     return number, unit
 
 
-def _floor_time(ts: datetime, delta: timedelta) -> datetime:
-    seconds = int(delta.total_seconds())
-    if seconds <= 0:
-        return ts
-    epoch = int(ts.timestamp())
-    bucket = epoch - (epoch % seconds)
-    return datetime.fromtimestamp(bucket)
-
-
-def _average(values: list[float]) -> float:
-    return sum(values) / len(values) if values else 0.0
-
-
 def _percentile(values: list[float], percentile: int) -> float:
     if not values:
         return 0.0
@@ -2,15 +2,53 @@
 
 from __future__ import annotations
 
+import functools
 import logging
-from typing import Any
+from collections import OrderedDict
+from typing import Any, cast
 
 from ragkit.config.schema_v2 import RerankingConfigV2
 from ragkit.models import Chunk
 from ragkit.reranking.base_reranker import BaseReranker, RerankResult
+from ragkit.utils.locks import KeyedLocks
 
 logger = logging.getLogger(__name__)
 
+_MAX_LENGTH = 512
+# Only concurrent loads of the same (model, device, dtype) wait for each other
+_MODEL_LOCKS = KeyedLocks()
+
+
+def _build_cross_encoder(
+    cross_encoder_cls: Any, model_name: str, device: str, dtype_name: str
+) -> Any:
+    """Instantiate a CrossEncoder and cast its weights to ``dtype_name``."""
+    model = cross_encoder_cls(
+        model_name,
+        device=device,
+        max_length=_MAX_LENGTH,  # Truncate long documents
+    )
+
+    # Apply reduced-precision weights
+    if dtype_name != "float32":
+        try:
+            import torch
+
+            model.model.to(getattr(torch, dtype_name))
+            logger.info(f"Using {dtype_name} weights")
+        except Exception as e:
+            logger.warning(f"Failed to convert weights to {dtype_name}: {e}")
+
+    return model
+
+
+@functools.lru_cache(maxsize=8)
+def _shared_cross_encoder(model_name: str, device: str, dtype_name: str) -> Any:
+    """Process-wide CrossEncoder cache so rerankers reuse loaded weights."""
+    from sentence_transformers import CrossEncoder
+
+    return _build_cross_encoder(CrossEncoder, model_name, device, dtype_name)
+
 
 class CrossEncoderReranker(BaseReranker):
     """Cross-encoder based reranker using sentence-transformers.
@@ -28,6 +66,7 @@ class CrossEncoderReranker(BaseReranker):
         - Batch processing for efficiency
         - Half-precision (FP16) to reduce VRAM usage
         - Model caching to avoid reloading
+        - LRU cache of (query, document) scores for repeated pairs
         - Configurable score thresholds
 
     Typical usage:
@@ -51,6 +90,7 @@ class CrossEncoderReranker(BaseReranker):
         self.config = config
         self.model: Any | None = None
         self._device: str | None = None
+        self._score_cache: OrderedDict[tuple[str, str], float] = OrderedDict()
 
     def _load_model(self) -> None:
         """Load cross-encoder model with optimizations.
@@ -61,7 +101,8 @@ class CrossEncoderReranker(BaseReranker):
         Optimizations:
             - GPU usage if available and configured
             - Half-precision (FP16) on GPU to reduce VRAM
-            - Model caching to avoid reloading between requests
+            - Model caching to avoid reloading between requests; with
+              cache_model, loaded weights are shared across rerankers
         """
         # If model cached and caching enabled, skip reload
         if self.model is not None and self.config.cache_model:
@@ -96,24 +137,44 @@ class CrossEncoderReranker(BaseReranker):
             self._device = "cpu"
             logger.info("Using CPU for cross-encoder (use_gpu=False)")
 
-        # Load model
-        model = CrossEncoder(
-            self.config.reranker_model,
-            device=self._device,
-            max_length=512,  # Truncate long documents
-        )
-        self.model = model
+        # torch's intra-op pool is process-wide; only resize it when asked to
+        if self._device == "cpu" and self.config.cpu_threads:
+            import torch
 
-        # Apply half-precision on GPU
-        if self.config.half_precision and self._device == "cuda":
-            try:
-                model.model.half()
-                logger.info("Using FP16 half-precision")
-            except Exception as e:
-                logger.warning(f"Failed to enable half-precision: {e}")
+            torch.set_num_threads(self.config.cpu_threads)
+            logger.info(f"Using {self.config.cpu_threads} CPU threads")
+
+        # Load model, sharing weights across rerankers when caching is enabled
+        dtype_name = self._resolve_dtype()
+        if self.config.cache_model:
+            key = (self.config.reranker_model, self._device, dtype_name)
+            with _MODEL_LOCKS(key):
+                self.model = _shared_cross_encoder(*key)
+        else:
+            self.model = _build_cross_encoder(
+                CrossEncoder, self.config.reranker_model, self._device, dtype_name
+            )
 
         logger.info(f"Model loaded successfully on {self._device}")
 
+    def _resolve_dtype(self) -> str:
+        """Pick the weight dtype from ``torch_dtype`` and ``half_precision``.
+
+        ``half_precision`` is shorthand for ``torch_dtype="float16"`` (the config
+        rejects combining it with bfloat16). float16 is only applied on CUDA
+        because CPU kernels for it are slow or missing, so on CPU the model
+        stays in float32.
+        """
+        dtype_name = self.config.torch_dtype
+        if dtype_name == "float32" and self.config.half_precision:
+            dtype_name = "float16"
+
+        if dtype_name == "float16" and self._device != "cuda":
+            logger.warning(f"float16 weights require CUDA; keeping float32 on {self._device}")
+            return "float32"
+
+        return dtype_name
+
     async def rerank(
         self,
         query: str,
@@ -164,20 +225,11 @@ class CrossEncoderReranker(BaseReranker):
         logger.debug(f"Scoring {len(pairs)} pairs with batch_size={self.config.rerank_batch_size}")
 
         try:
-            scores = model.predict(
-                pairs,
-                batch_size=self.config.rerank_batch_size,
-                show_progress_bar=False,
-                convert_to_numpy=True,
-            )
+            scores = self._cached_score_pairs(model, pairs)
         except Exception as e:
             logger.error(f"Cross-encoder scoring failed: {e}")
             raise
 
-        # Convert scores to list if numpy array
-        if hasattr(scores, "tolist"):
-            scores = scores.tolist()
-
         # Combine chunks with scores
         scored_chunks = list(zip(candidates, scores, strict=False))
 
@@ -200,6 +252,73 @@ class CrossEncoderReranker(BaseReranker):
 
         return results
 
+    def _cached_score_pairs(self, model: Any, pairs: list[tuple[str, str]]) -> list[float]:
+        """Score pairs, running the model only on pairs not in the LRU cache.
+
+        A reranker's model and precision are fixed, so a (query, document)
+        pair always gets the same score and can be reused across calls.
+        """
+        cache_size = self.config.score_cache_size
+        if cache_size == 0:
+            return self._score_pairs(model, pairs)
+
+        cache = self._score_cache
+        scores: list[float | None] = [cache.get(pair) for pair in pairs]
+        misses = [index for index, score in enumerate(scores) if score is None]
+        for pair, score in zip(pairs, scores, strict=True):
+            if score is not None:
+                cache.move_to_end(pair)
+
+        if misses:
+            logger.debug(f"Score cache: {len(pairs) - len(misses)} hits, {len(misses)} misses")
+            new_scores = self._score_pairs(model, [pairs[index] for index in misses])
+            for index, score in zip(misses, new_scores, strict=True):
+                scores[index] = score
+                cache[pairs[index]] = score
+            while len(cache) > cache_size:
+                cache.popitem(last=False)
+
+        return cast(list[float], scores)
+
+    def _score_pairs(self, model: Any, pairs: list[tuple[str, str]]) -> list[float]:
+        """Score (query, document) pairs with a single tokenizer call.
+
+        All pairs are tokenized at once without padding and ordered by token
+        length, so each forward-pass mini-batch is padded only to the longest
+        of similarly sized sequences. Scores are returned in input order.
+        Logits are upcast to float32 before the activation so reduced-precision
+        weights return the same kind of scores as float32 ones.
+        """
+        import torch
+
+        tokenizer = model.tokenizer
+        encoded = tokenizer(
+            [query for query, _ in pairs],
+            [document for _, document in pairs],
+            truncation=True,
+            max_length=_MAX_LENGTH,
+        )
+        input_ids = encoded["input_ids"]
+        order = sorted(range(len(pairs)), key=lambda index: len(input_ids[index]), reverse=True)
+        activation = getattr(model, "activation_fn", None) or model.default_activation_function
+        batch_size = self.config.rerank_batch_size
+
+        scores = [0.0] * len(pairs)
+        with torch.inference_mode():
+            for start in range(0, len(order), batch_size):
+                indices = order[start : start + batch_size]
+                batch = tokenizer.pad(
+                    {key: [values[index] for index in indices] for key, values in encoded.items()},
+                    return_tensors="pt",
+                ).to(model.model.device)
+                logits = activation(model.model(**batch).logits.float())
+                if logits.shape[-1] == 1:
+                    logits = logits.squeeze(-1)
+                for index, score in zip(indices, logits.cpu().tolist(), strict=True):
+                    scores[index] = score
+
+        return scores
+
     def __del__(self) -> None:
         """Cleanup model on deletion if not caching."""
         if not self.config.cache_model and self.model is not None:
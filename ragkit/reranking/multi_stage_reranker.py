@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from ragkit.config.schema_v2 import RerankingConfigV2
@@ -76,6 +77,9 @@ class MultiStageReranker(BaseReranker):
             cache_model=config.cache_model,
             rerank_threshold=0.0,  # No filtering in stage 1
             half_precision=False,  # TinyBERT is already small
+            torch_dtype=config.torch_dtype,
+            cpu_threads=config.cpu_threads,
+            score_cache_size=config.score_cache_size,
         )
 
         self.stage_1_reranker = CrossEncoderReranker(stage_1_config)
@@ -90,11 +94,30 @@ class MultiStageReranker(BaseReranker):
             cache_model=config.cache_model,
             rerank_threshold=config.rerank_threshold,
             half_precision=config.half_precision,
+            torch_dtype=config.torch_dtype,
+            cpu_threads=config.cpu_threads,
+            score_cache_size=config.score_cache_size,
         )
 
         self.stage_2_reranker = CrossEncoderReranker(stage_2_config)
         logger.info(f"Stage 2 (precise): {config.stage_2_model}")
 
+        # Stage settings are fixed once the stage rerankers exist; build the
+        # summary once instead of on every get_stage_info() call.
+        self._stage_info = {
+            "stage_1": {
+                "model": stage_1_config.reranker_model,
+                "keep_top": config.stage_1_keep_top,
+                "batch_size": stage_1_config.rerank_batch_size,
+            },
+            "stage_2": {
+                "model": stage_2_config.reranker_model,
+                "batch_size": stage_2_config.rerank_batch_size,
+                "threshold": stage_2_config.rerank_threshold,
+                "half_precision": stage_2_config.half_precision,
+            },
+        }
+
     async def rerank(
         self,
         query: str,
@@ -127,13 +150,30 @@ class MultiStageReranker(BaseReranker):
             f"Multi-stage reranking: {len(candidates)} → {self.config.stage_1_keep_top} → {top_k}"
         )
 
+        # Stage 2 needs the global stage-1 ranking, so the stages themselves run in
+        # order; but on the first call, load both models in worker threads so the
+        # stage-2 load overlaps stage 1 and neither blocks the event loop.
+        loop = asyncio.get_running_loop()
+        stage_1_load = _start_model_load(self.stage_1_reranker, loop)
+        stage_2_load = _start_model_load(self.stage_2_reranker, loop)
+
         # Stage 1: Fast filter
         logger.debug(f"Stage 1: Filtering to top {self.config.stage_1_keep_top}")
-        stage_1_results = await self.stage_1_reranker.rerank(
-            query,
-            candidates,
-            top_k=self.config.stage_1_keep_top,
-        )
+        try:
+            if stage_1_load is not None:
+                await stage_1_load
+            stage_1_results = await self.stage_1_reranker.rerank(
+                query,
+                candidates,
+                top_k=self.config.stage_1_keep_top,
+            )
+        except BaseException:
+            if stage_2_load is not None:
+                await asyncio.gather(stage_2_load, return_exceptions=True)
+            raise
+
+        if stage_2_load is not None:
+            await stage_2_load
 
         # Extract chunks from stage 1 results
         filtered_chunks = [result.chunk for result in stage_1_results]
@@ -158,16 +198,18 @@ class MultiStageReranker(BaseReranker):
         Returns:
             Dictionary with stage models and parameters
         """
-        return {
-            "stage_1": {
-                "model": self.config.stage_1_model,
-                "keep_top": self.config.stage_1_keep_top,
-                "batch_size": 32,
-            },
-            "stage_2": {
-                "model": self.config.stage_2_model,
-                "batch_size": self.config.rerank_batch_size,
-                "threshold": self.config.rerank_threshold,
-                "half_precision": self.config.half_precision,
-            },
-        }
+        return {stage: dict(info) for stage, info in self._stage_info.items()}
+
+
+def _start_model_load(
+    reranker: CrossEncoderReranker, loop: asyncio.AbstractEventLoop
+) -> asyncio.Future[None] | None:
+    """Load a reranker's model in a worker thread, or return None if not needed.
+
+    Only rerankers with ``cache_model`` keep a loaded model: without it,
+    ``rerank()`` loads the weights on every call, so a prefetch would load
+    them twice.
+    """
+    if reranker.model is not None or not reranker.config.cache_model:
+        return None
+    return loop.run_in_executor(None, reranker._load_model)
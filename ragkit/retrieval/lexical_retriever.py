@@ -8,6 +8,7 @@ from rank_bm25 import BM25Okapi, BM25Plus
 from ragkit.config.schema_v2 import RetrievalConfigV2
 from ragkit.models import Chunk
 from ragkit.retrieval.base_retriever import BaseRetriever, SearchResult
+from ragkit.retrieval.utils.bm25 import BM25Scorer
 from ragkit.retrieval.utils.tokenizers import create_tokenizer
 
 
@@ -30,6 +31,7 @@ class LexicalRetriever(BaseRetriever):
         self.config = config
         self.tokenizer = create_tokenizer(config)
         self.bm25: BM25Okapi | BM25Plus | None = None
+        self._scorer: BM25Scorer | None = None
         self.chunks: list[Chunk] = []
         self.tokenized_docs: list[list[str]] = []
 
@@ -64,6 +66,8 @@ class LexicalRetriever(BaseRetriever):
                 b=self.config.bm25_b,
             )
 
+        self._scorer = BM25Scorer(self.bm25)
+
     async def search(
         self,
         query: str,
@@ -80,7 +84,7 @@ class LexicalRetriever(BaseRetriever):
         Returns:
             List of SearchResult, sorted by BM25 score
         """
-        if self.bm25 is None or not self.chunks:
+        if self._scorer is None or not self.chunks:
             return []
 
         # 1. Tokenize query
@@ -90,7 +94,7 @@ class LexicalRetriever(BaseRetriever):
             return []
 
         # 2. BM25 scoring
-        scores = self.bm25.get_scores(tokenized_query)
+        scores = self._scorer.get_scores(tokenized_query)
 
         # 3. Get top-k indices
         top_indices = np.argsort(scores)[::-1][:top_k]
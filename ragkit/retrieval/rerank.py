@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from itertools import islice
 
 from ragkit.config.schema import RerankConfig
 from ragkit.exceptions import RetrievalError
@@ -29,8 +30,9 @@ class NoOpReranker(BaseReranker):
         top_n: int,
         relevance_threshold: float = 0.0,
     ) -> list[RetrievalResult]:
-        filtered = [result for result in results if result.score >= relevance_threshold]
-        return filtered[:top_n]
+        # Stop scanning once top_n results have passed the threshold
+        passing = (result for result in results if result.score >= relevance_threshold)
+        return list(islice(passing, max(top_n, 0)))
 
 
 class CohereReranker(BaseReranker):
@@ -8,6 +8,7 @@ from ragkit.models import Chunk
 from ragkit.retrieval.base_retriever import BaseRetriever, SearchResult
 from ragkit.retrieval.mmr import maximal_marginal_relevance
 from ragkit.vectorstore.chromadb_adapter import ChromaDBAdapter
+from ragkit.vectorstore.flat_adapter import FlatVectorAdapter
 
 
 class SemanticRetriever(BaseRetriever):
@@ -22,7 +23,7 @@ class SemanticRetriever(BaseRetriever):
 
     def __init__(
         self,
-        vectordb: ChromaDBAdapter,
+        vectordb: ChromaDBAdapter | FlatVectorAdapter,
         embedder: AdvancedEmbedder,
         config: RetrievalConfigV2,
     ):
@@ -0,0 +1,86 @@
+"""Vectorized BM25 scoring over a rank_bm25 index."""
+
+from __future__ import annotations
+
+import numpy as np
+from rank_bm25 import BM25Okapi, BM25Plus
+
+
+class BM25Scorer:
+    """Score queries against a fitted ``rank_bm25`` index using term postings.
+
+    ``rank_bm25`` recomputes each query term's frequency by looping over every
+    document's frequency dict in Python. This scorer keeps the index's IDF,
+    ``delta`` and document lengths, but builds an inverted index once
+    (term -> document indices and term frequencies), so a query only touches
+    the documents that contain its terms. With the index's own ``k1`` and
+    ``b``, scores are identical to ``bm25.get_scores``.
+    """
+
+    def __init__(
+        self,
+        bm25: BM25Okapi | BM25Plus,
+        k1: float | None = None,
+        b: float | None = None,
+    ) -> None:
+        """Build postings from a fitted BM25Okapi or BM25Plus index.
+
+        IDF does not depend on ``k1`` or ``b``, so one fitted index can back
+        several scorers with different saturation settings.
+
+        Args:
+            bm25: Fitted rank_bm25 index
+            k1: Term-frequency saturation (defaults to the index's ``k1``)
+            b: Length normalization (defaults to the index's ``b``)
+        """
+        self.bm25 = bm25
+        self.k1 = bm25.k1 if k1 is None else k1
+        self.b = bm25.b if b is None else b
+        self._corpus_size = bm25.corpus_size
+        self._delta = bm25.delta if isinstance(bm25, BM25Plus) else None
+
+        doc_len = np.array(bm25.doc_len)
+        self._length_norm = self.k1 * (1 - self.b + self.b * doc_len / bm25.avgdl)
+
+        postings: dict[str, tuple[list[int], list[int]]] = {}
+        for doc_index, frequencies in enumerate(bm25.doc_freqs):
+            for term, frequency in frequencies.items():
+                doc_indices, term_frequencies = postings.setdefault(term, ([], []))
+                doc_indices.append(doc_index)
+                term_frequencies.append(frequency)
+
+        self._postings = {
+            term: (np.array(doc_indices, dtype=np.intp), np.array(term_frequencies))
+            for term, (doc_indices, term_frequencies) in postings.items()
+        }
+
+    def get_scores(self, query: list[str]) -> np.ndarray:
+        """Compute BM25 scores of every document for a tokenized query.
+
+        Args:
+            query: Query tokens (repeated tokens count once per occurrence)
+
+        Returns:
+            np.ndarray of shape (num_documents,)
+        """
+        bm25 = self.bm25
+        scores = np.zeros(self._corpus_size)
+
+        for term in query:
+            idf = bm25.idf.get(term) or 0
+            if not idf:
+                continue
+
+            doc_indices, term_frequencies = self._postings[term]
+            norm = self._length_norm[doc_indices]
+            saturation = term_frequencies * (self.k1 + 1) / (term_frequencies + norm)
+
+            if self._delta is None:
+                scores[doc_indices] += idf * saturation
+            else:
+                # BM25+ adds the delta lower bound to every document, matched or not.
+                contribution = np.full(self._corpus_size, idf * self._delta)
+                contribution[doc_indices] = idf * (self._delta + saturation)
+                scores += contribution
+
+        return scores
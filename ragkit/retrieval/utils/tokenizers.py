@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 
 from ragkit.config.schema_v2 import RetrievalConfigV2
 
+_WORD_RE = re.compile(r"\b\w+\b")
+
 
 class BaseTokenizer(ABC):
     """Abstract base class for tokenizers."""
@@ -48,13 +52,15 @@ class StandardTokenizer(BaseTokenizer):
             if custom_stopwords:
                 self.stopwords.update(custom_stopwords)
 
-        # Initialize stemmer if needed
+        # Initialize stemmer if needed; corpora repeat terms, so memoize stems
         self.stemmer = None
+        self._stem: Callable[[str], str] | None = None
         if stemming:
             try:
                 from nltk.stem import PorterStemmer
 
                 self.stemmer = PorterStemmer()
+                self._stem = functools.lru_cache(maxsize=100_000)(self.stemmer.stem)
             except ImportError:
                 print("Warning: NLTK not available, stemming disabled")
 
@@ -72,15 +78,16 @@ class StandardTokenizer(BaseTokenizer):
             text = text.lower()
 
         # Split on whitespace and punctuation
-        tokens = re.findall(r"\b\w+\b", text)
+        tokens = _WORD_RE.findall(text)
 
         # Remove stopwords
         if self.remove_stopwords:
             tokens = [t for t in tokens if t not in self.stopwords]
 
         # Apply stemming
-        if self.stemmer:
-            tokens = [self.stemmer.stem(t) for t in tokens]
+        if self._stem:
+            stem = self._stem
+            tokens = [stem(t) for t in tokens]
 
         return tokens
 
@@ -156,7 +163,7 @@ class NGramTokenizer(BaseTokenizer):
             text = text.lower()
 
         # Split into words
-        words = re.findall(r"\b\w+\b", text)
+        words = _WORD_RE.findall(text)
 
         # Generate n-grams
         ngrams = []
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from dataclasses import dataclass
 from typing import Any
@@ -39,6 +40,25 @@ _PII_PATTERNS: dict[str, re.Pattern[str]] = {
 }
 
 
+@functools.lru_cache(maxsize=16)
+def _combined_pattern(entity_types: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile the enabled PII patterns into one alternation scanned in a single pass.
+
+    Each entity becomes a named group and the text is scanned left to right:
+    the leftmost match wins, and only at the same starting offset do earlier
+    entity types take precedence. Matches never overlap, so an entity nested in
+    or overlapping a match that starts earlier is not reported.
+    """
+    alternatives = [
+        f"(?P<{entity_type}>{_PII_PATTERNS[entity_type].pattern})"
+        for entity_type in dict.fromkeys(entity_types)
+        if entity_type in _PII_PATTERNS
+    ]
+    if not alternatives:
+        return None
+    return re.compile("|".join(alternatives))
+
+
 class PIIDetector:
     """Detect and redact PII based on configuration."""
 
@@ -115,28 +135,28 @@ class PIIDetector:
         return entities, results
 
     def _detect_with_regex(self, text: str) -> list[PIIEntity]:
-        entities: list[PIIEntity] = []
-        for entity_type in self.config.pii_entities:
-            pattern = _PII_PATTERNS.get(entity_type)
-            if not pattern:
-                continue
-            for match in pattern.finditer(text):
-                entities.append(
-                    PIIEntity(
-                        entity_type=entity_type,
-                        start=match.start(),
-                        end=match.end(),
-                        score=1.0,
-                        value=match.group(0),
-                    )
-                )
-        return entities
+        pattern = _combined_pattern(tuple(self.config.pii_entities))
+        if pattern is None:
+            return []
+        return [
+            PIIEntity(
+                entity_type=match.lastgroup or "",
+                start=match.start(),
+                end=match.end(),
+                score=1.0,
+                value=match.group(0),
+            )
+            for match in pattern.finditer(text)
+        ]
 
     def _redact_with_regex(self, text: str, entities: list[PIIEntity]) -> str:
-        redacted = text
-        for entity_type in self.config.pii_entities:
-            pattern = _PII_PATTERNS.get(entity_type)
-            if not pattern:
+        parts: list[str] = []
+        cursor = 0
+        for entity in sorted(entities, key=lambda item: item.start):
+            if entity.start < cursor:
                 continue
-            redacted = pattern.sub(f"[{entity_type}]", redacted)
-        return redacted
+            parts.append(text[cursor : entity.start])
+            parts.append(f"[{entity.entity_type}]")
+            cursor = entity.end
+        parts.append(text[cursor:])
+        return "".join(parts)
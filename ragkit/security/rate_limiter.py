@@ -9,10 +9,14 @@ from dataclasses import dataclass
 from ragkit.security.exceptions import RateLimitExceededException
 
 
-@dataclass
-class _Bucket:
-    count: int
-    window_start: float
+@dataclass(slots=True)
+class _Usage:
+    """Minute and day counters for one user, kept in a single slotted record."""
+
+    minute_count: int
+    minute_start: float
+    day_count: int
+    day_start: float
 
 
 class RateLimiter:
@@ -21,8 +25,7 @@ class RateLimiter:
     def __init__(self, max_per_minute: int, max_per_day: int) -> None:
         self.max_per_minute = max_per_minute
         self.max_per_day = max_per_day
-        self._minute_bucket: dict[str, _Bucket] = {}
-        self._day_bucket: dict[str, _Bucket] = {}
+        self._usage: dict[str, _Usage] = {}
         self._lock = asyncio.Lock()
 
     async def check_rate_limit(self, user_id: str | None) -> None:
@@ -30,25 +33,32 @@ class RateLimiter:
         key = user_id or "anonymous"
         async with self._lock:
             now = time.time()
-            self._consume(self._minute_bucket, key, now, 60.0, self.max_per_minute)
-            self._consume(self._day_bucket, key, now, 86400.0, self.max_per_day)
-
-    def _consume(
-        self,
-        bucket: dict[str, _Bucket],
-        key: str,
-        now: float,
-        window_seconds: float,
-        limit: int,
-    ) -> None:
-        entry = bucket.get(key)
-        if entry is None or (now - entry.window_start) >= window_seconds:
-            bucket[key] = _Bucket(count=1, window_start=now)
-            return
-
-        if entry.count >= limit:
-            raise RateLimitExceededException(
-                f"Rate limit exceeded ({limit} per {int(window_seconds)}s)"
-            )
-
-        entry.count += 1
+            usage = self._usage.get(key)
+            if usage is None:
+                self._usage[key] = _Usage(
+                    minute_count=1,
+                    minute_start=now,
+                    day_count=1,
+                    day_start=now,
+                )
+                return
+
+            if (now - usage.minute_start) >= 60.0:
+                usage.minute_count = 1
+                usage.minute_start = now
+            elif usage.minute_count >= self.max_per_minute:
+                raise RateLimitExceededException(
+                    f"Rate limit exceeded ({self.max_per_minute} per 60s)"
+                )
+            else:
+                usage.minute_count += 1
+
+            if (now - usage.day_start) >= 86400.0:
+                usage.day_count = 1
+                usage.day_start = now
+            elif usage.day_count >= self.max_per_day:
+                raise RateLimitExceededException(
+                    f"Rate limit exceeded ({self.max_per_day} per 86400s)"
+                )
+            else:
+                usage.day_count += 1
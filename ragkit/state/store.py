@@ -4,19 +4,42 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 
 class StateStore:
-    def __init__(self, db_path: Path | None = None) -> None:
-        self.db_path = db_path or Path(".ragkit") / "state.db"
+    def __init__(self, db_path: Path | str | None = None) -> None:
+        """Open (or create) the state database.
+
+        Args:
+            db_path: SQLite file, or ``":memory:"`` to keep state in memory for
+                the lifetime of the store
+        """
+        self.db_path = Path(db_path) if db_path is not None else Path(".ragkit") / "state.db"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection for the store's lifetime, shared by API worker threads.
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._lock = threading.Lock()
         self._init_db()
 
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Run a transaction on the shared connection (commits on success)."""
+        with self._lock, self._conn:
+            yield self._conn
+
+    def close(self) -> None:
+        """Close the database connection; the store can't be used afterwards."""
+        with self._lock:
+            self._conn.close()
+
     def _init_db(self) -> None:
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.executescript(
                 """
                 CREATE TABLE IF NOT EXISTS state (
@@ -36,7 +59,7 @@ class StateStore:
             )
 
     def get(self, key: str, default: Any = None) -> Any:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             row = conn.execute("SELECT value FROM state WHERE key = ?", (key,)).fetchone()
         if row is None:
             return default
@@ -48,14 +71,14 @@ class StateStore:
     def set(self, key: str, value: Any) -> None:
         payload = json.dumps(_serialize(value))
         updated_at = datetime.now(timezone.utc).isoformat()
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute(
                 "INSERT OR REPLACE INTO state (key, value, updated_at) VALUES (?, ?, ?)",
                 (key, payload, updated_at),
             )
 
     def get_ingestion_history(self, limit: int = 10) -> list[dict]:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             rows = conn.execute(
                 """
                 SELECT id, started_at, completed_at, stats, status
@@ -94,7 +117,7 @@ class StateStore:
         started_at = started_at or datetime.now(timezone.utc)
         stats_payload = json.dumps(_serialize(stats)) if stats is not None else None
         completed_payload = completed_at.isoformat() if completed_at else None
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 """
                 INSERT INTO ingestion_history (started_at, completed_at, stats, status)
@@ -8,6 +8,9 @@ from typing import TypeVar
 
 T = TypeVar("T")
 
+# Module-level so tests can replace it without patching asyncio itself
+_sleep = asyncio.sleep
+
 
 async def run_with_timeout(coro: Awaitable[T], timeout: float) -> T:
     return await asyncio.wait_for(coro, timeout=timeout)
@@ -26,7 +29,7 @@ async def retry_async(
             last_exc = exc
             if attempt >= max_retries - 1:
                 raise
-            await asyncio.sleep(delay)
+            await _sleep(delay)
     if last_exc:
         raise last_exc
     raise RuntimeError("retry_async reached an unexpected state")
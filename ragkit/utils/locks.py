@@ -0,0 +1,26 @@
+"""Thread locks keyed by value."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Hashable
+
+
+class KeyedLocks:
+    """One ``threading.Lock`` per key, created on first use.
+
+    Serializes work on the same key (such as loading one model) without
+    making work on other keys wait. Locks are kept for the life of the
+    object, so keys should come from a small set.
+    """
+
+    def __init__(self) -> None:
+        self._locks: dict[Hashable, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def __call__(self, key: Hashable) -> threading.Lock:
+        with self._guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.Lock()
+            return lock
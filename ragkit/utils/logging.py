@@ -31,9 +31,11 @@ def _build_handlers(config: ObservabilityConfig) -> list[logging.Handler]:
 def setup_logging(config: ObservabilityConfig) -> structlog.BoundLogger:
     """Configure structlog according to config."""
     level = getattr(logging, config.logging.level, logging.INFO)
-    handlers = _build_handlers(config)
 
-    logging.basicConfig(level=level, handlers=handlers, format="%(message)s")
+    # basicConfig ignores its handlers once the root logger has any; skip building
+    # them so repeated setup does not open log files that would never be used.
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=level, handlers=_build_handlers(config), format="%(message)s")
 
     processors: list[structlog.types.Processor] = [
         structlog.processors.TimeStamper(fmt="iso"),
@@ -19,16 +19,20 @@ class ChromaDBAdapter:
     Ideal for prototyping and datasets <1M vectors.
     """
 
-    def __init__(self, config: VectorDBConfigV2):
+    def __init__(self, config: VectorDBConfigV2, client: Any | None = None):
         """Initialize the ChromaDB adapter.
 
         Args:
             config: Vector DB configuration
+            client: Existing ChromaDB client to reuse (ex: one client shared by
+                several collections). Built from the config when None.
         """
         self.config = config
 
         # ChromaDB client
-        if config.in_memory:
+        if client is not None:
+            self.client = client
+        elif config.in_memory:
             self.client = chromadb.Client()
         else:
             storage_path = config.storage_path or "./data/vectordb"
@@ -97,8 +101,8 @@ class ChromaDBAdapter:
             metadatas.append(metadata)
         embeddings_list = embeddings.tolist()
 
-        # Insert by batch
-        batch_size = self.config.batch_size
+        # Insert by batch, never exceeding what the Chroma client accepts in one add()
+        batch_size = min(self.config.batch_size, self._max_batch_size())
 
         for i in range(0, len(chunks), batch_size):
             batch_ids = ids[i : i + batch_size]
@@ -162,6 +166,13 @@ class ChromaDBAdapter:
         chunks_with_scores.sort(key=lambda item: item[1], reverse=True)
         return chunks_with_scores
 
+    def _max_batch_size(self) -> int:
+        """Largest number of records the Chroma client accepts in one ``add`` call."""
+        get_max_batch_size = getattr(self.client, "get_max_batch_size", None)
+        if get_max_batch_size is None:
+            return self.config.batch_size
+        return get_max_batch_size()
+
     def _generate_id(self, chunk: Chunk, index: int) -> str:
         """Generate a unique ID for a chunk.
 
@@ -0,0 +1,116 @@
+"""Exact in-memory vector search with NumPy, for small collections."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from ragkit.config.schema_v2 import VectorDBConfigV2
+from ragkit.models import Chunk
+
+
+class FlatVectorAdapter:
+    """Brute-force vector search over a contiguous float32 matrix.
+
+    Every query is scored against all stored vectors with one matrix-vector
+    product, so results are exact and deterministic. For small collections
+    (tests, prototypes, a few thousand chunks) this is faster than building
+    and querying an HNSW index. Same interface as ``ChromaDBAdapter``.
+    """
+
+    def __init__(self, config: VectorDBConfigV2):
+        """Initialize the flat adapter.
+
+        Args:
+            config: Vector DB configuration (only ``distance_metric`` is used)
+        """
+        self.config = config
+        self.chunks: list[Chunk] = []
+        self._matrix: np.ndarray | None = None
+
+    async def insert_batch(
+        self,
+        chunks: list[Chunk],
+        embeddings: np.ndarray,
+    ) -> None:
+        """Insert a batch of chunks with their embeddings.
+
+        Args:
+            chunks: List of chunks to insert
+            embeddings: Corresponding embeddings (shape: len(chunks) x dims)
+        """
+        if len(chunks) == 0:
+            return
+
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        if self.config.distance_metric == "cosine":
+            vectors = _unit_rows(vectors)
+
+        self._matrix = vectors if self._matrix is None else np.vstack([self._matrix, vectors])
+        self.chunks.extend(chunks)
+
+    async def search(
+        self,
+        query_embedding: np.ndarray,
+        top_k: int = 10,
+        filters: dict | None = None,
+    ) -> list[tuple[Chunk, float]]:
+        """Search for the top_k most similar vectors.
+
+        Args:
+            query_embedding: Query vector (shape: dims)
+            top_k: Number of results to return
+            filters: Equality filters on metadata (ex: {"source": "manual.pdf"})
+
+        Returns:
+            List of tuples (Chunk, score), best first
+        """
+        if self._matrix is None:
+            return []
+
+        scores = self._scores(np.asarray(query_embedding, dtype=np.float32))
+
+        candidates = np.arange(len(self.chunks))
+        if filters:
+            candidates = np.flatnonzero(
+                [
+                    all(
+                        key in chunk.metadata and chunk.metadata[key] == value
+                        for key, value in filters.items()
+                    )
+                    for chunk in self.chunks
+                ]
+            )
+
+        k = min(top_k, len(candidates))
+        if k <= 0:
+            return []
+
+        candidate_scores = scores[candidates]
+        if k < len(candidates):
+            top = np.argpartition(-candidate_scores, k - 1)[:k]
+        else:
+            top = np.arange(len(candidates))
+        top = top[np.argsort(-candidate_scores[top], kind="stable")]
+
+        return [(self.chunks[candidates[i]], float(candidate_scores[i])) for i in top]
+
+    def _scores(self, query: np.ndarray) -> np.ndarray:
+        """Similarity of the query to every stored vector (higher is better)."""
+        matrix = self._matrix
+        assert matrix is not None
+
+        metric = self.config.distance_metric
+        if metric == "cosine":
+            return matrix @ _unit_rows(query[np.newaxis, :])[0]
+        if metric == "euclidean":
+            # Squared L2, like Chroma's "l2" space
+            return -np.square(matrix - query).sum(axis=1)
+        if metric == "manhattan":
+            return -np.abs(matrix - query).sum(axis=1)
+        return matrix @ query
+
+
+def _unit_rows(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize rows, leaving zero vectors unchanged."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
@@ -2,6 +2,8 @@
 
 import pytest
 
+from ragkit.config.schema_v2 import EmbeddingConfigV2
+from ragkit.embedding.advanced_embedder import AdvancedEmbedder
 from ragkit.vectorstore.base import SearchResult
 from tests.helpers import (
     DummyEmbedder,
@@ -32,6 +34,26 @@ def dummy_retrieval():
     return DummyRetrieval()
 
 
+@pytest.fixture(scope="session")
+def minilm_embedder():
+    """all-MiniLM-L6-v2 embedder shared by the whole session.
+
+    Its embedding cache (keyed by text hash) persists across tests, so
+    chunks and queries that repeat between modules are embedded once.
+    """
+    return AdvancedEmbedder(
+        EmbeddingConfigV2(provider="sentence_transformers", model="all-MiniLM-L6-v2")
+    )
+
+
+@pytest.fixture(scope="session")
+def chroma_client():
+    """In-memory ChromaDB client shared by the whole session."""
+    import chromadb
+
+    return chromadb.EphemeralClient()
+
+
 @pytest.fixture
 def sample_chunk():
     return make_chunk(
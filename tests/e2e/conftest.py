@@ -9,9 +9,6 @@ from typing import Any
 
 import pytest
 
-pytest.importorskip("torch")
-pytest.importorskip("sentence_transformers")
-
 from ragkit.config.schema_v2 import (
     EmbeddingConfigV2,
     RerankingConfigV2,
@@ -25,9 +22,19 @@ from ragkit.retrieval.hybrid_retriever import HybridRetriever
 from ragkit.retrieval.lexical_retriever import LexicalRetriever
 from ragkit.retrieval.semantic_retriever import SemanticRetriever
 from ragkit.vectorstore.chromadb_adapter import ChromaDBAdapter
+from tests.helpers import requires_sentence_transformers
 
 # E2E fixtures are also inherited from tests/conftest.py (sample_docs, etc.)
 
+_E2E_DIR = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Skip E2E tests without torch/sentence-transformers, without importing them."""
+    for item in items:
+        if item.path.is_relative_to(_E2E_DIR):
+            item.add_marker(requires_sentence_transformers)
+
 
 @pytest.fixture(scope="session")
 def event_loop():
@@ -16,6 +16,8 @@ import time
 
 import pytest
 
+from tests.helpers import assert_scores_descending
+
 
 class TestFullRAGPipelineV2:
     """Test complete RAG pipeline end-to-end with V2 components."""
@@ -88,10 +90,7 @@ class TestFullRAGPipelineV2:
             assert all(r.rank in range(1, 6) for r in reranked_results), "Ranks should be 1-5"
 
             # Check scores are descending
-            for i in range(len(reranked_results) - 1):
-                assert reranked_results[i].score >= reranked_results[i + 1].score, (
-                    "Scores should be descending"
-                )
+            assert_scores_descending(reranked_results)
 
             # Check relevance (at least one expected doc in top 5)
             top_parent_ids = {r.chunk.metadata.get("parent_id") for r in reranked_results}
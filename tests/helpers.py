@@ -2,13 +2,28 @@
 
 from __future__ import annotations
 
+import importlib.util
 import types
 from typing import Any
 
+import numpy as np
+import pytest
+
 from ragkit.embedding.base import BaseEmbedder
 from ragkit.models import Chunk, GeneratedResponse, QueryAnalysis, RetrievalResult
 from ragkit.vectorstore.base import BaseVectorStore, SearchResult, VectorStoreStats
 
+# ---------------------------------------------------------------------------
+# Optional dependency markers
+# ---------------------------------------------------------------------------
+
+# find_spec only locates the packages, so collection does not pay for importing torch.
+requires_sentence_transformers = pytest.mark.skipif(
+    any(importlib.util.find_spec(name) is None for name in ("torch", "sentence_transformers")),
+    reason="torch and sentence-transformers are required",
+)
+
+
 # ---------------------------------------------------------------------------
 # LLM test doubles
 # ---------------------------------------------------------------------------
@@ -177,3 +192,14 @@ def make_retrieval_result(
     if chunk is None:
         chunk = make_chunk()
     return RetrievalResult(chunk=chunk, score=score, retrieval_type=retrieval_type)
+
+
+# ---------------------------------------------------------------------------
+# Assertions
+# ---------------------------------------------------------------------------
+
+
+def assert_scores_descending(results: list[Any]) -> None:
+    """Assert that result objects exposing ``.score`` are sorted best-first."""
+    scores = np.fromiter((result.score for result in results), dtype=np.float64)
+    assert np.all(np.diff(scores) <= 0), f"Scores should be descending: {scores.tolist()}"
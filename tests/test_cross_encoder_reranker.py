@@ -2,13 +2,64 @@
 
 from __future__ import annotations
 
-import pytest
+import subprocess
+import sys
+from types import SimpleNamespace
 
-pytest.importorskip("sentence_transformers")
+import pytest
 
 from ragkit.config.schema_v2 import RerankingConfigV2
 from ragkit.models import Chunk
 from ragkit.reranking.cross_encoder_reranker import CrossEncoderReranker
+from tests.helpers import requires_sentence_transformers
+
+pytestmark = requires_sentence_transformers
+
+
+class _WordTokenizer:
+    """Tokenizer double: one token per word, each token id is the word length."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.padded_lengths: list[int] = []
+
+    def __call__(self, queries, documents, truncation=True, max_length=512):
+        self.calls += 1
+        input_ids = [[len(word) for word in document.split()] for document in documents]
+        return {
+            "input_ids": input_ids,
+            "attention_mask": [[1] * len(ids) for ids in input_ids],
+        }
+
+    def pad(self, features, return_tensors="pt"):
+        from transformers import BatchEncoding
+
+        width = max(len(ids) for ids in features["input_ids"])
+        self.padded_lengths.append(width)
+        return BatchEncoding(
+            {
+                key: [row + [0] * (width - len(row)) for row in rows]
+                for key, rows in features.items()
+            },
+            tensor_type=return_tensors,
+        )
+
+
+class _SumModel:
+    """Model double scoring a pair as the sum of its token ids."""
+
+    device = "cpu"
+
+    def __call__(self, input_ids, attention_mask):
+        return SimpleNamespace(logits=(input_ids * attention_mask).sum(dim=-1, keepdim=True))
+
+
+def _fake_cross_encoder() -> SimpleNamespace:
+    return SimpleNamespace(
+        tokenizer=_WordTokenizer(),
+        model=_SumModel(),
+        activation_fn=lambda logits: logits,
+    )
 
 
 class TestCrossEncoderReranker:
@@ -292,3 +343,137 @@ class TestModelCaching:
 
         # Model should be None before first use
         assert reranker.model is None
+
+    def test_import_does_not_load_torch(self):
+        """torch and sentence-transformers are only imported by _load_model."""
+        code = (
+            "import sys, ragkit.reranking; "
+            "print(any(m in sys.modules for m in ('torch', 'sentence_transformers')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_half_precision_falls_back_to_float32_on_cpu(self):
+        """float16 is only applied on CUDA."""
+        reranker = CrossEncoderReranker(RerankingConfigV2(use_gpu=False, half_precision=True))
+        reranker._device = "cpu"
+        assert reranker._resolve_dtype() == "float32"
+
+        reranker._device = "cuda"
+        assert reranker._resolve_dtype() == "float16"
+
+    def test_explicit_bfloat16_kept_on_cpu(self):
+        """bfloat16 is honoured on CPU."""
+        reranker = CrossEncoderReranker(RerankingConfigV2(use_gpu=False, torch_dtype="bfloat16"))
+        reranker._device = "cpu"
+        assert reranker._resolve_dtype() == "bfloat16"
+
+    def test_half_precision_conflicts_with_bfloat16(self):
+        """The two precision knobs cannot disagree."""
+        with pytest.raises(ValueError, match="half_precision"):
+            RerankingConfigV2(half_precision=True, torch_dtype="bfloat16")
+
+
+class TestPairScoring:
+    """Tests for batched pair scoring without a real model."""
+
+    def test_pairs_tokenized_once_and_scores_aligned(self):
+        """One tokenizer call for all pairs; scores follow input order."""
+        reranker = CrossEncoderReranker(RerankingConfigV2(use_gpu=False, rerank_batch_size=2))
+        model = _fake_cross_encoder()
+        documents = ["aaa", "bb bb", "c", "dddd e", "ff"]
+
+        scores = reranker._score_pairs(model, [("q", document) for document in documents])
+
+        assert model.tokenizer.calls == 1
+        assert scores == [3.0, 4.0, 1.0, 5.0, 2.0]
+
+    def test_batches_grouped_by_token_length(self):
+        """Similar lengths share a batch, so padding stays minimal."""
+        reranker = CrossEncoderReranker(RerankingConfigV2(use_gpu=False, rerank_batch_size=2))
+        model = _fake_cross_encoder()
+        documents = ["a", "b b b b", "c", "d d d", "e e"]
+
+        scores = reranker._score_pairs(model, [("q", document) for document in documents])
+
+        assert model.tokenizer.padded_lengths == [4, 2, 1]
+        assert scores == [1.0, 4.0, 1.0, 3.0, 2.0]
+
+    def test_repeated_pairs_served_from_score_cache(self):
+        """Only unseen pairs reach the model; the cache is bounded LRU."""
+        reranker = CrossEncoderReranker(
+            RerankingConfigV2(use_gpu=False, rerank_batch_size=8, score_cache_size=3)
+        )
+        model = _fake_cross_encoder()
+
+        first = reranker._cached_score_pairs(model, [("q", "aa"), ("q", "b b")])
+        second = reranker._cached_score_pairs(model, [("q", "b b"), ("q", "ccc"), ("q", "aa")])
+
+        assert first == [2.0, 2.0]
+        assert second == [2.0, 3.0, 2.0]
+        assert model.tokenizer.calls == 2
+        assert model.tokenizer.padded_lengths == [2, 1]
+
+        reranker._cached_score_pairs(model, [("q", "dddd")])
+        assert list(reranker._score_cache) == [("q", "aa"), ("q", "ccc"), ("q", "dddd")]
+
+    def test_score_cache_disabled(self):
+        """score_cache_size=0 scores every pair on every call."""
+        reranker = CrossEncoderReranker(RerankingConfigV2(use_gpu=False, score_cache_size=0))
+        model = _fake_cross_encoder()
+
+        for _ in range(2):
+            reranker._cached_score_pairs(model, [("q", "aa")])
+
+        assert model.tokenizer.calls == 2
+        assert not reranker._score_cache
+
+    def test_cached_rerankers_share_loaded_model(self, monkeypatch):
+        """cache_model shares weights across rerankers; without it each loads its own."""
+        import sentence_transformers
+
+        from ragkit.reranking import cross_encoder_reranker as module
+
+        loads: list[str] = []
+
+        class FakeCrossEncoder:
+            def __init__(self, name: str, device: str, max_length: int) -> None:
+                loads.append(name)
+
+        monkeypatch.setattr(sentence_transformers, "CrossEncoder", FakeCrossEncoder)
+        module._shared_cross_encoder.cache_clear()
+        try:
+            cached = [
+                CrossEncoderReranker(RerankingConfigV2(use_gpu=False, cache_model=True))
+                for _ in range(2)
+            ]
+            for reranker in cached:
+                reranker._load_model()
+            uncached = CrossEncoderReranker(RerankingConfigV2(use_gpu=False, cache_model=False))
+            uncached._load_model()
+        finally:
+            module._shared_cross_encoder.cache_clear()
+
+        assert cached[0].model is cached[1].model
+        assert uncached.model is not cached[0].model
+        assert len(loads) == 2
+
+    def test_cpu_threads_applied_on_cpu(self, monkeypatch):
+        """cpu_threads resizes torch's intra-op pool when running on CPU."""
+        import sentence_transformers
+        import torch
+
+        class FakeCrossEncoder:
+            def __init__(self, name: str, device: str, max_length: int) -> None:
+                pass
+
+        calls: list[int] = []
+        monkeypatch.setattr(sentence_transformers, "CrossEncoder", FakeCrossEncoder)
+        monkeypatch.setattr(torch, "set_num_threads", calls.append)
+
+        config = RerankingConfigV2(use_gpu=False, cache_model=False, cpu_threads=3)
+        CrossEncoderReranker(config)._load_model()
+
+        assert calls == [3]
@@ -5,11 +5,11 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
-pytest.importorskip("torch")
-pytest.importorskip("sentence_transformers")
-
 from ragkit.config.schema_v2 import EmbeddingConfigV2
 from ragkit.embedding.advanced_embedder import AdvancedEmbedder
+from tests.helpers import requires_sentence_transformers
+
+pytestmark = requires_sentence_transformers
 
 
 class TestEmbeddingCaching:
@@ -66,6 +66,48 @@ class TestEmbeddingCaching:
         # Verify cache contains 3 entries
         assert len(embedder.cache) == 3
 
+    @pytest.mark.asyncio
+    async def test_cold_batch_not_aliased_with_cache(self):
+        """A batch with no cache hits is returned as a copy of the cached rows."""
+
+        class CountingProvider:
+            async def embed(self, texts: list[str]) -> np.ndarray:
+                return np.arange(len(texts) * 4, dtype=np.float32).reshape(len(texts), 4) + 1
+
+        embedder = AdvancedEmbedder(
+            EmbeddingConfigV2(cache_embeddings=True, normalize_embeddings=False)
+        )
+        embedder._provider = CountingProvider()
+
+        first = await embedder.embed_batch(["a", "b", "c"])
+        expected = first.copy()
+        first[:] = 0
+
+        second = await embedder.embed_batch(["a", "b", "c"])
+        np.testing.assert_array_equal(second, expected)
+
+    def test_providers_share_loaded_model(self, monkeypatch):
+        """Providers with the same model settings reuse one loaded model."""
+        from ragkit.embedding.providers import sentence_transformers_provider as module
+
+        loads: list[str] = []
+
+        class FakeSentenceTransformer:
+            def __init__(self, name: str, device: str) -> None:
+                loads.append(name)
+
+        monkeypatch.setattr(module, "SentenceTransformer", FakeSentenceTransformer)
+        module._load_model.cache_clear()
+        try:
+            config = EmbeddingConfigV2(provider="sentence_transformers", model="fake-model")
+            first = module.SentenceTransformersProvider(config)
+            second = module.SentenceTransformersProvider(config)
+        finally:
+            module._load_model.cache_clear()
+
+        assert first.model is second.model
+        assert loads == ["fake-model"]
+
 
 class TestRateLimiter:
     """Tests for rate limiter."""
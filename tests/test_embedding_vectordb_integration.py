@@ -4,14 +4,14 @@ from __future__ import annotations
 
 import pytest
 
-pytest.importorskip("torch")
-pytest.importorskip("sentence_transformers")
-
 from ragkit.config.schema_v2 import EmbeddingConfigV2, VectorDBConfigV2
 from ragkit.embedding.advanced_embedder import AdvancedEmbedder
 from ragkit.ingestion.chunkers.factory import create_chunker
 from ragkit.ingestion.parsers.base import ParsedDocument
 from ragkit.vectorstore.chromadb_adapter import ChromaDBAdapter
+from tests.helpers import requires_sentence_transformers
+
+pytestmark = requires_sentence_transformers
 
 
 class TestCompletePipeline:
@@ -38,7 +38,7 @@ class TestCompletePipeline:
         )
 
     @pytest.mark.asyncio
-    async def test_chunk_embed_insert_search(self, sample_document):
+    async def test_chunk_embed_insert_search(self, sample_document, minilm_embedder):
         """Test complete pipeline: chunk -> embed -> insert -> search."""
         # Step 1: Chunking
         chunker = create_chunker("fixed_size", chunk_size=100, chunk_overlap=20)
@@ -47,16 +47,8 @@ class TestCompletePipeline:
         assert len(chunks) > 0
 
         # Step 2: Embedding
-        embedding_config = EmbeddingConfigV2(
-            provider="sentence_transformers",
-            model="all-MiniLM-L6-v2",
-            cache_embeddings=True,
-        )
-        embedder = AdvancedEmbedder(embedding_config)
-
-        # Extract chunk contents
         chunk_texts = [chunk.content for chunk in chunks]
-        embeddings = await embedder.embed_batch(chunk_texts)
+        embeddings = await minilm_embedder.embed_batch(chunk_texts)
 
         assert embeddings.shape[0] == len(chunks)
         assert embeddings.shape[1] == 384  # all-MiniLM-L6-v2 dimensions
@@ -73,7 +65,7 @@ class TestCompletePipeline:
 
         # Step 4: Search
         query = "What is Python?"
-        query_embedding = await embedder.embed_query(query)
+        query_embedding = await minilm_embedder.embed_query(query)
 
         results = await adapter.search(query_embedding, top_k=5)
 
@@ -119,7 +111,7 @@ class TestCompletePipeline:
         np.testing.assert_array_equal(embeddings_1, embeddings_2)
 
     @pytest.mark.asyncio
-    async def test_search_with_metadata_filters(self):
+    async def test_search_with_metadata_filters(self, minilm_embedder):
         """Test search with metadata filters."""
         from ragkit.models import Chunk
 
@@ -140,13 +132,8 @@ class TestCompletePipeline:
         ]
 
         # Embed
-        embedding_config = EmbeddingConfigV2(
-            provider="sentence_transformers", model="all-MiniLM-L6-v2"
-        )
-        embedder = AdvancedEmbedder(embedding_config)
-
         chunk_texts = [chunk.content for chunk in chunks]
-        embeddings = await embedder.embed_batch(chunk_texts)
+        embeddings = await minilm_embedder.embed_batch(chunk_texts)
 
         # Insert into VectorDB
         vectordb_config = VectorDBConfigV2(
@@ -160,7 +147,7 @@ class TestCompletePipeline:
 
         # Search with filter
         query = "Python documentation"
-        query_embedding = await embedder.embed_query(query)
+        query_embedding = await minilm_embedder.embed_query(query)
 
         results = await adapter.search(query_embedding, top_k=10, filters={"source": "manual.pdf"})
 
@@ -170,7 +157,7 @@ class TestCompletePipeline:
             assert chunk.metadata["source"] == "manual.pdf"
 
     @pytest.mark.asyncio
-    async def test_parent_child_chunking_with_embedding(self):
+    async def test_parent_child_chunking_with_embedding(self, minilm_embedder):
         """Test parent-child chunking strategy with embeddings."""
         document = ParsedDocument(
             content="This is a test sentence. " * 200,  # Long document
@@ -189,13 +176,8 @@ class TestCompletePipeline:
             assert "parent_content" in chunk.metadata
 
         # Embed child chunks
-        embedding_config = EmbeddingConfigV2(
-            provider="sentence_transformers", model="all-MiniLM-L6-v2"
-        )
-        embedder = AdvancedEmbedder(embedding_config)
-
         chunk_texts = [chunk.content for chunk in chunks]
-        embeddings = await embedder.embed_batch(chunk_texts)
+        embeddings = await minilm_embedder.embed_batch(chunk_texts)
 
         # Verify embeddings
         assert embeddings.shape[0] == len(chunks)
@@ -1,5 +1,6 @@
 """Tests for advanced ingestion parsing and preprocessing."""
 
+import asyncio
 import builtins
 import sys
 import types
@@ -277,6 +278,156 @@ class TestAdvancedPDFParser:
         assert "Hello world" in parsed.content
         assert parsed.metadata["total_pages"] == 1
 
+    @pytest.mark.asyncio
+    async def test_parse_pages_concurrently_in_order(self, parser_config, tmp_path, monkeypatch):
+        dummy_file = tmp_path / "sample.pdf"
+        dummy_file.write_bytes(b"%PDF-1.4")
+
+        class DummyPage:
+            def __init__(self, text):
+                self.text = text
+
+            def extract_text(self):
+                return self.text
+
+            def find_tables(self):
+                return []
+
+        class DummyPDF:
+            def __init__(self):
+                self.pages = [DummyPage(f"Page text {idx}") for idx in range(5)]
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, exc_type, exc, tb):
+                return False
+
+        dummy_module = types.SimpleNamespace(open=lambda path: DummyPDF())
+        monkeypatch.setitem(sys.modules, "pdfplumber", dummy_module)
+
+        parser = AdvancedPDFParser(parser_config)
+        parser.config.page_concurrency = 2
+        parser.config.skip_empty_pages = False
+        parser.config.footer_removal = False
+        parser.config.page_number_removal = False
+
+        in_flight = 0
+        peak = 0
+        original_parse_page = parser._parse_page
+
+        async def tracking_parse_page(page, page_num):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            try:
+                return await original_parse_page(page, page_num)
+            finally:
+                in_flight -= 1
+
+        monkeypatch.setattr(parser, "_parse_page", tracking_parse_page)
+        parsed = await parser.parse(dummy_file)
+
+        assert [page["page_number"] for page in parsed.pages] == [1, 2, 3, 4, 5]
+        assert parsed.pages[4]["text"] == "Page text 4"
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_parse_cancels_pending_pages_on_error(self, parser_config, tmp_path, monkeypatch):
+        dummy_file = tmp_path / "sample.pdf"
+        dummy_file.write_bytes(b"%PDF-1.4")
+
+        state = {"closed": False, "touched_after_close": False, "cancelled": 0}
+
+        class DummyPDF:
+            def __init__(self):
+                self.pages = [object() for _ in range(4)]
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, exc_type, exc, tb):
+                state["closed"] = True
+                return False
+
+        monkeypatch.setitem(
+            sys.modules, "pdfplumber", types.SimpleNamespace(open=lambda path: DummyPDF())
+        )
+
+        parser = AdvancedPDFParser(parser_config)
+        parser.config.page_concurrency = 4
+
+        async def failing_parse_page(page, page_num):
+            if page_num == 1:
+                raise RuntimeError("broken page")
+            try:
+                await asyncio.sleep(0.05)
+            except asyncio.CancelledError:
+                state["cancelled"] += 1
+                raise
+            state["touched_after_close"] = state["closed"]
+            return {"page_number": page_num, "text": ""}
+
+        monkeypatch.setattr(parser, "_parse_page", failing_parse_page)
+
+        with pytest.raises(RuntimeError, match="broken page"):
+            await parser.parse(dummy_file)
+
+        await asyncio.sleep(0.1)
+        assert state["cancelled"] == 3
+        assert state["touched_after_close"] is False
+
+    @pytest.mark.asyncio
+    async def test_parse_uses_content_hash_cache(self, parser_config, tmp_path, monkeypatch):
+        first_file = tmp_path / "first.pdf"
+        first_file.write_bytes(b"%PDF-1.4 same")
+        copy_file = tmp_path / "copy.pdf"
+        copy_file.write_bytes(b"%PDF-1.4 same")
+
+        class DummyPage:
+            def extract_text(self):
+                return "Cached page text"
+
+            def find_tables(self):
+                return []
+
+        class DummyPDF:
+            def __init__(self):
+                self.pages = [DummyPage()]
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, exc_type, exc, tb):
+                return False
+
+        opened = []
+
+        def fake_open(path):
+            opened.append(path)
+            return DummyPDF()
+
+        monkeypatch.setitem(sys.modules, "pdfplumber", types.SimpleNamespace(open=fake_open))
+
+        parser_config.cache_enabled = True
+        parser_config.cache_dir = str(tmp_path / "cache")
+        parser_config.skip_empty_pages = False
+        parser_config.footer_removal = False
+        parser_config.page_number_removal = False
+
+        first = await AdvancedPDFParser(parser_config).parse(first_file)
+        second = await AdvancedPDFParser(parser_config).parse(copy_file)
+
+        assert len(opened) == 1
+        assert second.content == first.content
+        assert second.pages == first.pages
+        assert second.metadata["source_file"] == str(copy_file)
+
+        parser_config.table_extraction_strategy = "preserve"
+        await AdvancedPDFParser(parser_config).parse(copy_file)
+        assert len(opened) == 2
+
 
 class TestTextPreprocessing:
     """Tests for text preprocessing."""
@@ -733,6 +884,20 @@ class TestOCREngine:
 
         assert processed.mode == "L"
 
+    def test_image_preprocessing_matches_contrast_enhance(self):
+        pytest.importorskip("PIL")
+        from PIL import Image, ImageEnhance, ImageFilter
+
+        from ragkit.utils.ocr import OCREngine
+
+        engine = OCREngine(engine="tesseract", languages=["eng"], preprocessing=True)
+        img = Image.linear_gradient("L").resize((64, 48)).convert("RGB")
+
+        expected = ImageEnhance.Contrast(img.convert("L")).enhance(2.0)
+        expected = expected.filter(ImageFilter.SHARPEN)
+
+        assert engine._preprocess_image(img).tobytes() == expected.tobytes()
+
     @pytest.mark.asyncio
     async def test_extract_text_with_preprocessing_tesseract(self, monkeypatch):
         pil = pytest.importorskip("PIL")
@@ -1050,6 +1215,12 @@ class TestTableExtractor:
 class TestImageProcessor:
     """Tests for image extraction metadata."""
 
+    @pytest.fixture(autouse=True)
+    def clear_blip_cache(self):
+        ImageProcessor._load_blip.cache_clear()
+        yield
+        ImageProcessor._load_blip.cache_clear()
+
     @pytest.mark.asyncio
     async def test_extract_images_from_page(self):
         config = DocumentParsingConfig(image_extraction_enabled=True)
@@ -1213,3 +1384,123 @@ class TestImageProcessor:
         processor = ImageProcessor(config)
         caption = await processor.generate_caption(b"image-bytes")
         assert caption == "caption"
+
+    @pytest.mark.asyncio
+    async def test_generate_caption_reuses_loaded_model(self, monkeypatch):
+        class DummyImage:
+            def convert(self, mode):
+                return self
+
+        class DummyImageModule:
+            @staticmethod
+            def open(buffer):
+                return DummyImage()
+
+        dummy_pil = types.SimpleNamespace(Image=DummyImageModule)
+        monkeypatch.setitem(sys.modules, "PIL", dummy_pil)
+        monkeypatch.setitem(sys.modules, "PIL.Image", DummyImageModule)
+
+        loads = []
+
+        class DummyProcessor:
+            @classmethod
+            def from_pretrained(cls, name):
+                loads.append(name)
+                return cls()
+
+            def __call__(self, image, return_tensors="pt"):
+                return {"pixel_values": [1]}
+
+            def decode(self, output, skip_special_tokens=True):
+                return "caption"
+
+        class DummyModel:
+            @classmethod
+            def from_pretrained(cls, name):
+                return cls()
+
+            def generate(self, **inputs):
+                return [[1, 2, 3]]
+
+        dummy_transformers = types.SimpleNamespace(
+            BlipProcessor=DummyProcessor,
+            BlipForConditionalGeneration=DummyModel,
+        )
+        monkeypatch.setitem(sys.modules, "transformers", dummy_transformers)
+
+        config = DocumentParsingConfig(image_captioning_model="dummy")
+        first = ImageProcessor(config)
+        second = ImageProcessor(config)
+        assert await first.generate_caption(b"a") == "caption"
+        assert await first.generate_caption(b"b") == "caption"
+        assert await second.generate_caption(b"c") == "caption"
+        assert loads == ["dummy"]
+
+    @pytest.mark.asyncio
+    async def test_generate_captions_batches_images(self, monkeypatch):
+        class DummyImage:
+            def convert(self, mode):
+                return self
+
+        class DummyImageModule:
+            @staticmethod
+            def open(buffer):
+                if buffer.getvalue() == b"bad":
+                    raise ValueError("bad image")
+                return DummyImage()
+
+        dummy_pil = types.SimpleNamespace(Image=DummyImageModule)
+        monkeypatch.setitem(sys.modules, "PIL", dummy_pil)
+        monkeypatch.setitem(sys.modules, "PIL.Image", DummyImageModule)
+
+        batches = []
+
+        class DummyProcessor:
+            @classmethod
+            def from_pretrained(cls, name):
+                return cls()
+
+            def __call__(self, images, return_tensors="pt"):
+                batches.append(len(images))
+                return {"pixel_values": images}
+
+            def batch_decode(self, output, skip_special_tokens=True):
+                return [f"caption-{idx}" for idx, _ in enumerate(output)]
+
+        class DummyModel:
+            @classmethod
+            def from_pretrained(cls, name):
+                return cls()
+
+            def generate(self, pixel_values, **kwargs):
+                return [[1] for _ in pixel_values]
+
+        dummy_transformers = types.SimpleNamespace(
+            BlipProcessor=DummyProcessor,
+            BlipForConditionalGeneration=DummyModel,
+        )
+        monkeypatch.setitem(sys.modules, "transformers", dummy_transformers)
+
+        config = DocumentParsingConfig(image_captioning_model="dummy")
+        processor = ImageProcessor(config)
+        captions = await processor.generate_captions([b"one", b"", b"bad", b"two"])
+        assert captions == ["caption-0", "", "", "caption-1"]
+        assert batches == [2]
+
+    @pytest.mark.asyncio
+    async def test_generate_caption_propagates_model_load_errors(self, monkeypatch):
+        class FailingProcessor:
+            @classmethod
+            def from_pretrained(cls, name):
+                raise OSError(f"{name} is not a valid model identifier")
+
+        dummy_transformers = types.SimpleNamespace(
+            BlipProcessor=FailingProcessor,
+            BlipForConditionalGeneration=FailingProcessor,
+        )
+        monkeypatch.setitem(sys.modules, "transformers", dummy_transformers)
+
+        config = DocumentParsingConfig(image_captioning_model="missing-model")
+        processor = ImageProcessor(config)
+        with pytest.raises(OSError, match="missing-model"):
+            await processor.generate_caption(b"img")
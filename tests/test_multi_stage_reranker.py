@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-import pytest
+import threading
 
-pytest.importorskip("torch")
-pytest.importorskip("sentence_transformers")
+import pytest
 
 from ragkit.config.schema_v2 import RerankingConfigV2
 from ragkit.models import Chunk
+from ragkit.reranking.cross_encoder_reranker import _shared_cross_encoder
 from ragkit.reranking.multi_stage_reranker import MultiStageReranker
+from tests.helpers import assert_scores_descending, requires_sentence_transformers
+
+pytestmark = requires_sentence_transformers
 
 
 class TestMultiStageReranker:
@@ -74,8 +77,7 @@ class TestMultiStageReranker:
         assert [r.rank for r in results] == [1, 2, 3, 4, 5]
 
         # Scores should be descending
-        for i in range(len(results) - 1):
-            assert results[i].score >= results[i + 1].score
+        assert_scores_descending(results)
 
     @pytest.mark.asyncio
     async def test_stage_1_filters_correctly(self, config, sample_chunks):
@@ -108,6 +110,71 @@ class TestMultiStageReranker:
         assert info["stage_2"]["model"] == "cross-encoder/ms-marco-MiniLM-L-6-v2"
         assert info["stage_2"]["batch_size"] == config.rerank_batch_size
 
+    @pytest.mark.asyncio
+    async def test_get_stage_info_returns_independent_copies(self, config):
+        """Mutating a returned summary must not leak into later calls."""
+        reranker = MultiStageReranker(config)
+
+        info = reranker.get_stage_info()
+        info["stage_1"]["keep_top"] = 999
+
+        assert reranker.get_stage_info()["stage_1"]["keep_top"] == 10
+
+    @pytest.fixture
+    def empty_model_cache(self):
+        """Start and end with no shared cross-encoders, so fake models never leak."""
+        _shared_cross_encoder.cache_clear()
+        yield
+        _shared_cross_encoder.cache_clear()
+
+    @staticmethod
+    def _fake_models(monkeypatch, reranker, cross_encoder_cls):
+        """Swap in a fake CrossEncoder class and skip real scoring."""
+        import sentence_transformers
+
+        monkeypatch.setattr(sentence_transformers, "CrossEncoder", cross_encoder_cls)
+        for stage in (reranker.stage_1_reranker, reranker.stage_2_reranker):
+            monkeypatch.setattr(stage, "_score_pairs", lambda model, pairs: [1.0] * len(pairs))
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("empty_model_cache")
+    async def test_stage_models_load_concurrently(self, config, sample_chunks, monkeypatch):
+        """On the first call both cached models load at once, off the event loop."""
+        loop_thread = threading.get_ident()
+        both_loading = threading.Barrier(2, timeout=5)
+        loaded: list[str] = []
+
+        class FakeCrossEncoder:
+            def __init__(self, model_name, device, max_length):
+                assert threading.get_ident() != loop_thread, "model loaded on the event loop"
+                # Breaks (and fails the load) unless the other stage is loading too
+                both_loading.wait()
+                loaded.append(model_name)
+
+        reranker = MultiStageReranker(config)
+        self._fake_models(monkeypatch, reranker, FakeCrossEncoder)
+
+        results = await reranker.rerank("query", sample_chunks, top_k=3)
+
+        assert len(results) == 3
+        assert sorted(loaded) == [config.stage_2_model, config.stage_1_model]
+
+    @pytest.mark.asyncio
+    async def test_uncached_models_load_once_per_call(self, config, sample_chunks, monkeypatch):
+        """Without cache_model there is no prefetch that would load stage 2 twice."""
+        loaded: list[str] = []
+
+        class FakeCrossEncoder:
+            def __init__(self, model_name, device, max_length):
+                loaded.append(model_name)
+
+        reranker = MultiStageReranker(config.model_copy(update={"cache_model": False}))
+        self._fake_models(monkeypatch, reranker, FakeCrossEncoder)
+
+        await reranker.rerank("query", sample_chunks, top_k=3)
+
+        assert sorted(loaded) == [config.stage_2_model, config.stage_1_model]
+
     @pytest.mark.asyncio
     async def test_multi_stage_with_few_candidates(self, config):
         """Test multi-stage with fewer candidates than stage_1_keep_top."""
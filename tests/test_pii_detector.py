@@ -26,3 +26,31 @@ def test_pii_block_mode():
 
     with pytest.raises(PIIDetectedException):
         detector.detect_and_redact("My SSN is 123-45-6789")
+
+
+def test_pii_detection_single_pass_preserves_entity_types():
+    config = SecurityConfigV2(pii_detection_mode="redact")
+    detector = PIIDetector(config)
+    detector._presidio_available = False
+
+    text = "Mail a@b.io, SSN 123-45-6789, host 192.168.1.10"
+    redacted, entities = detector.detect_and_redact(text)
+
+    assert [entity.entity_type for entity in entities] == [
+        "EMAIL_ADDRESS",
+        "SSN",
+        "IP_ADDRESS",
+    ]
+    assert redacted == "Mail [EMAIL_ADDRESS], SSN [SSN], host [IP_ADDRESS]"
+
+
+def test_pii_detection_leftmost_match_wins_on_overlap():
+    config = SecurityConfigV2(pii_detection_mode="redact")
+    detector = PIIDetector(config)
+    detector._presidio_available = False
+
+    # The card pattern starts first and swallows the embedded phone number.
+    redacted, entities = detector.detect_and_redact("785 001-5473878")
+
+    assert [entity.entity_type for entity in entities] == ["CREDIT_CARD"]
+    assert redacted == "[CREDIT_CARD]"
@@ -33,3 +33,18 @@ def test_prompt_builder_json_output_instruction():
     builder = PromptBuilder(config)
     prompt = builder.build_rag_prompt("Query", "[1] Source: doc\nAnswer in JSON.")
     assert "Return ONLY valid JSON" in prompt
+
+
+def test_prompt_builder_reflects_config_changes_between_calls():
+    config = LLMGenerationConfigV2(cite_sources=True, citation_format="numbered")
+    builder = PromptBuilder(config)
+
+    first = builder.build_rag_prompt("Q1", "[1] Source: a\nA.")
+    assert "Question: Q1" in first
+    assert "Cite your sources using [1]" in first
+
+    config.citation_format = "footnote"
+    second = builder.build_rag_prompt("Q2", "ctx")
+    assert "Question: Q2" in second
+    assert "footnotes" in second
+    assert "[1], [2], [3]" not in second
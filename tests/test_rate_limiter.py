@@ -15,3 +15,21 @@ async def test_rate_limit_enforced():
 
     with pytest.raises(RateLimitExceededException):
         await limiter.check_rate_limit("user123")
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_tracks_users_and_day_window(monkeypatch):
+    limiter = RateLimiter(max_per_minute=10, max_per_day=3)
+    clock = [1000.0]
+    monkeypatch.setattr("ragkit.security.rate_limiter.time.time", lambda: clock[0])
+
+    for _ in range(3):
+        await limiter.check_rate_limit("alice")
+        clock[0] += 61.0
+    await limiter.check_rate_limit("bob")
+
+    with pytest.raises(RateLimitExceededException, match="per 86400s"):
+        await limiter.check_rate_limit("alice")
+
+    clock[0] += 86400.0
+    await limiter.check_rate_limit("alice")
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import pytest
+import asyncio
 
-pytest.importorskip("torch")
-pytest.importorskip("sentence_transformers")
+import pytest
+import pytest_asyncio
 
 from ragkit.config.schema_v2 import (
     EmbeddingConfigV2,
@@ -21,122 +21,131 @@ from ragkit.retrieval.hybrid_retriever import HybridRetriever
 from ragkit.retrieval.lexical_retriever import LexicalRetriever
 from ragkit.retrieval.semantic_retriever import SemanticRetriever
 from ragkit.vectorstore.chromadb_adapter import ChromaDBAdapter
+from ragkit.vectorstore.flat_adapter import FlatVectorAdapter
+from tests.helpers import assert_scores_descending, requires_sentence_transformers
+
+# Model loading and indexing dominate these tests, so the pipelines are built once
+# per module and shared; tests only run queries against them.
+pytestmark = [requires_sentence_transformers, pytest.mark.asyncio(loop_scope="module")]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def setup_pipeline():
+    """Setup complete retrieval + reranking pipeline."""
+    # Configs
+    embedding_config = EmbeddingConfigV2(
+        provider="sentence_transformers",
+        model="all-MiniLM-L6-v2",
+        cache_embeddings=False,
+        torch_dtype="bfloat16",
+    )
+
+    vectordb_config = VectorDBConfigV2(
+        provider="chromadb",
+        in_memory=True,
+        collection_name="test_reranking_integration",
+    )
+
+    retrieval_config = RetrievalConfigV2(
+        retrieval_mode="hybrid",
+        alpha=0.5,
+        fusion_method="rrf",
+        top_k=20,  # Retrieve more for reranking
+    )
+
+    reranking_config = RerankingConfigV2(
+        reranker_enabled=True,
+        reranker_model="cross-encoder/ms-marco-MiniLM-L-6-v2",
+        rerank_top_n=20,
+        final_top_k=5,
+        use_gpu=False,
+        torch_dtype="bfloat16",
+    )
+
+    # Components
+    embedder = AdvancedEmbedder(embedding_config)
+    vectordb = ChromaDBAdapter(vectordb_config)
+
+    semantic = SemanticRetriever(vectordb, embedder, retrieval_config)
+    lexical = LexicalRetriever(retrieval_config)
+    hybrid = HybridRetriever(semantic, lexical, retrieval_config)
+
+    reranker = CrossEncoderReranker(reranking_config)
+
+    # Test documents
+    chunks = [
+        Chunk(
+            id="1",
+            content=(
+                "Best practices for securing API endpoints with authentication and authorization"
+            ),
+            metadata={"source": "security_guide.pdf"},
+        ),
+        Chunk(
+            id="2",
+            content="How to implement OAuth 2.0 for API security",
+            metadata={"source": "security_guide.pdf"},
+        ),
+        Chunk(
+            id="3",
+            content="API endpoint design patterns for REST services",
+            metadata={"source": "api_design.pdf"},
+        ),
+        Chunk(
+            id="4",
+            content="Python programming fundamentals and data structures",
+            metadata={"source": "python_tutorial.pdf"},
+        ),
+        Chunk(
+            id="5",
+            content="Machine learning algorithms and neural networks",
+            metadata={"source": "ml_course.pdf"},
+        ),
+        Chunk(
+            id="6",
+            content="JWT tokens for API authentication and session management",
+            metadata={"source": "security_guide.pdf"},
+        ),
+        Chunk(
+            id="7",
+            content="Database optimization techniques for web applications",
+            metadata={"source": "database_guide.pdf"},
+        ),
+        Chunk(
+            id="8",
+            content="API rate limiting and throttling strategies",
+            metadata={"source": "api_design.pdf"},
+        ),
+        Chunk(
+            id="9",
+            content="Docker containerization for microservices",
+            metadata={"source": "devops_guide.pdf"},
+        ),
+        Chunk(
+            id="10",
+            content="HTTPS and TLS for secure API communications",
+            metadata={"source": "security_guide.pdf"},
+        ),
+    ]
+
+    # Index documents; the BM25 index is independent of the embedding pass
+    texts = [c.content for c in chunks]
+    embeddings, _ = await asyncio.gather(
+        embedder.embed_batch(texts),
+        asyncio.to_thread(lexical.index_documents, chunks),
+    )
+    await vectordb.insert_batch(chunks, embeddings)
+
+    return {
+        "retriever": hybrid,
+        "reranker": reranker,
+        "chunks": chunks,
+    }
 
 
 class TestRetrievalReranking:
     """Integration tests for retrieval + reranking pipeline."""
 
-    @pytest.fixture
-    async def setup_pipeline(self):
-        """Setup complete retrieval + reranking pipeline."""
-        # Configs
-        embedding_config = EmbeddingConfigV2(
-            provider="sentence_transformers",
-            model="all-MiniLM-L6-v2",
-            cache_embeddings=False,
-        )
-
-        vectordb_config = VectorDBConfigV2(
-            provider="chromadb",
-            in_memory=True,
-            collection_name="test_reranking_integration",
-        )
-
-        retrieval_config = RetrievalConfigV2(
-            retrieval_mode="hybrid",
-            alpha=0.5,
-            fusion_method="rrf",
-            top_k=20,  # Retrieve more for reranking
-        )
-
-        reranking_config = RerankingConfigV2(
-            reranker_enabled=True,
-            reranker_model="cross-encoder/ms-marco-MiniLM-L-6-v2",
-            rerank_top_n=20,
-            final_top_k=5,
-            use_gpu=False,
-        )
-
-        # Components
-        embedder = AdvancedEmbedder(embedding_config)
-        vectordb = ChromaDBAdapter(vectordb_config)
-
-        semantic = SemanticRetriever(vectordb, embedder, retrieval_config)
-        lexical = LexicalRetriever(retrieval_config)
-        hybrid = HybridRetriever(semantic, lexical, retrieval_config)
-
-        reranker = CrossEncoderReranker(reranking_config)
-
-        # Test documents
-        chunks = [
-            Chunk(
-                id="1",
-                content=(
-                    "Best practices for securing API endpoints with authentication and "
-                    "authorization"
-                ),
-                metadata={"source": "security_guide.pdf"},
-            ),
-            Chunk(
-                id="2",
-                content="How to implement OAuth 2.0 for API security",
-                metadata={"source": "security_guide.pdf"},
-            ),
-            Chunk(
-                id="3",
-                content="API endpoint design patterns for REST services",
-                metadata={"source": "api_design.pdf"},
-            ),
-            Chunk(
-                id="4",
-                content="Python programming fundamentals and data structures",
-                metadata={"source": "python_tutorial.pdf"},
-            ),
-            Chunk(
-                id="5",
-                content="Machine learning algorithms and neural networks",
-                metadata={"source": "ml_course.pdf"},
-            ),
-            Chunk(
-                id="6",
-                content="JWT tokens for API authentication and session management",
-                metadata={"source": "security_guide.pdf"},
-            ),
-            Chunk(
-                id="7",
-                content="Database optimization techniques for web applications",
-                metadata={"source": "database_guide.pdf"},
-            ),
-            Chunk(
-                id="8",
-                content="API rate limiting and throttling strategies",
-                metadata={"source": "api_design.pdf"},
-            ),
-            Chunk(
-                id="9",
-                content="Docker containerization for microservices",
-                metadata={"source": "devops_guide.pdf"},
-            ),
-            Chunk(
-                id="10",
-                content="HTTPS and TLS for secure API communications",
-                metadata={"source": "security_guide.pdf"},
-            ),
-        ]
-
-        # Index documents
-        texts = [c.content for c in chunks]
-        embeddings = await embedder.embed_batch(texts)
-        await vectordb.insert_batch(chunks, embeddings)
-        lexical.index_documents(chunks)
-
-        return {
-            "retriever": hybrid,
-            "reranker": reranker,
-            "chunks": chunks,
-        }
-
-    @pytest.mark.asyncio
     async def test_e2e_retrieval_reranking(self, setup_pipeline):
         """Test end-to-end retrieval → reranking pipeline."""
         retriever = setup_pipeline["retriever"]
@@ -167,8 +176,7 @@ class TestRetrievalReranking:
         assert all(r.rank in range(1, 6) for r in reranked_results)
 
         # Scores should be descending
-        for i in range(len(reranked_results) - 1):
-            assert reranked_results[i].score >= reranked_results[i + 1].score
+        assert_scores_descending(reranked_results)
 
         # Top results should be API security related
         top_3_ids = {r.chunk.id for r in reranked_results[:3]}
@@ -177,7 +185,6 @@ class TestRetrievalReranking:
         overlap = len(top_3_ids & security_docs)
         assert overlap >= 2, f"Expected security docs in top 3, got {top_3_ids}"
 
-    @pytest.mark.asyncio
     async def test_reranking_improves_precision(self, setup_pipeline):
         """Test that reranking improves precision over retrieval alone."""
         retriever = setup_pipeline["retriever"]
@@ -213,7 +220,6 @@ class TestRetrievalReranking:
         # At minimum, reranking shouldn't hurt significantly
         assert precision_reranked >= precision_retrieval - 0.2
 
-    @pytest.mark.asyncio
     async def test_reranking_changes_order(self, setup_pipeline):
         """Test that reranking actually changes result order."""
         retriever = setup_pipeline["retriever"]
@@ -236,58 +242,59 @@ class TestRetrievalReranking:
         assert differences >= 1, "Reranking should change order of at least 1 document"
 
 
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def multi_stage_pipeline():
+    """Semantic retrieval over 50 chunks feeding a multi-stage reranker."""
+    embedding_config = EmbeddingConfigV2(
+        provider="sentence_transformers",
+        model="all-MiniLM-L6-v2",
+        torch_dtype="bfloat16",
+    )
+
+    vectordb_config = VectorDBConfigV2(provider="flat")
+
+    retrieval_config = RetrievalConfigV2(
+        retrieval_mode="semantic",
+        top_k=50,  # Retrieve many candidates
+    )
+
+    reranking_config = RerankingConfigV2(
+        reranker_enabled=True,
+        multi_stage_reranking=True,
+        stage_1_model="cross-encoder/ms-marco-TinyBERT-L-2-v2",
+        stage_2_model="cross-encoder/ms-marco-MiniLM-L-6-v2",
+        stage_1_keep_top=20,
+        rerank_top_n=50,
+        final_top_k=5,
+        use_gpu=False,
+        torch_dtype="bfloat16",
+    )
+
+    # Components
+    embedder = AdvancedEmbedder(embedding_config)
+    vectordb = FlatVectorAdapter(vectordb_config)
+    retriever = SemanticRetriever(vectordb, embedder, retrieval_config)
+    reranker = MultiStageReranker(reranking_config)
+
+    # Index documents
+    chunks = [
+        Chunk(id=f"doc_{i}", content=f"API security document {i}", metadata={}) for i in range(30)
+    ] + [Chunk(id=f"other_{i}", content=f"Unrelated document {i}", metadata={}) for i in range(20)]
+
+    texts = [c.content for c in chunks]
+    embeddings = await embedder.embed_batch(texts)
+    await vectordb.insert_batch(chunks, embeddings)
+
+    return {"retriever": retriever, "reranker": reranker}
+
+
 class TestMultiStageIntegration:
     """Integration tests for multi-stage reranking."""
 
-    @pytest.mark.asyncio
-    async def test_multi_stage_e2e(self):
+    async def test_multi_stage_e2e(self, multi_stage_pipeline):
         """Test end-to-end pipeline with multi-stage reranking."""
-        # Setup
-        embedding_config = EmbeddingConfigV2(
-            provider="sentence_transformers",
-            model="all-MiniLM-L6-v2",
-        )
-
-        vectordb_config = VectorDBConfigV2(
-            provider="chromadb",
-            in_memory=True,
-            collection_name="test_multistage",
-        )
-
-        retrieval_config = RetrievalConfigV2(
-            retrieval_mode="semantic",
-            top_k=50,  # Retrieve many candidates
-        )
-
-        reranking_config = RerankingConfigV2(
-            reranker_enabled=True,
-            multi_stage_reranking=True,
-            stage_1_model="cross-encoder/ms-marco-TinyBERT-L-2-v2",
-            stage_2_model="cross-encoder/ms-marco-MiniLM-L-6-v2",
-            stage_1_keep_top=20,
-            rerank_top_n=50,
-            final_top_k=5,
-            use_gpu=False,
-        )
-
-        # Components
-        embedder = AdvancedEmbedder(embedding_config)
-        vectordb = ChromaDBAdapter(vectordb_config)
-        retriever = SemanticRetriever(vectordb, embedder, retrieval_config)
-        reranker = MultiStageReranker(reranking_config)
-
-        # Index documents
-        chunks = [
-            Chunk(id=f"doc_{i}", content=f"API security document {i}", metadata={})
-            for i in range(30)
-        ] + [
-            Chunk(id=f"other_{i}", content=f"Unrelated document {i}", metadata={})
-            for i in range(20)
-        ]
-
-        texts = [c.content for c in chunks]
-        embeddings = await embedder.embed_batch(texts)
-        await vectordb.insert_batch(chunks, embeddings)
+        retriever = multi_stage_pipeline["retriever"]
+        reranker = multi_stage_pipeline["reranker"]
 
         # Query
         query = "API security best practices"
@@ -309,59 +316,66 @@ class TestMultiStageIntegration:
         assert stage_info["stage_2"]["model"] == "cross-encoder/ms-marco-MiniLM-L-6-v2"
 
 
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def filtered_pipeline():
+    """Semantic retrieval over chunks tagged with a language for filtered reranking."""
+    embedding_config = EmbeddingConfigV2(
+        provider="sentence_transformers",
+        model="all-MiniLM-L6-v2",
+    )
+
+    vectordb_config = VectorDBConfigV2(
+        provider="chromadb",
+        in_memory=True,
+        collection_name="test_filtered_rerank",
+    )
+
+    retrieval_config = RetrievalConfigV2(retrieval_mode="semantic")
+    reranking_config = RerankingConfigV2(
+        reranker_enabled=True,
+        reranker_model="cross-encoder/ms-marco-MiniLM-L-6-v2",
+        use_gpu=False,
+    )
+
+    # Components
+    embedder = AdvancedEmbedder(embedding_config)
+    vectordb = ChromaDBAdapter(vectordb_config)
+    retriever = SemanticRetriever(vectordb, embedder, retrieval_config)
+    reranker = CrossEncoderReranker(reranking_config)
+
+    # Documents with metadata
+    chunks = [
+        Chunk(
+            id="1",
+            content="API security in Python",
+            metadata={"language": "python"},
+        ),
+        Chunk(
+            id="2",
+            content="API security in JavaScript",
+            metadata={"language": "javascript"},
+        ),
+        Chunk(
+            id="3",
+            content="API security in Go",
+            metadata={"language": "go"},
+        ),
+    ]
+
+    texts = [c.content for c in chunks]
+    embeddings = await embedder.embed_batch(texts)
+    await vectordb.insert_batch(chunks, embeddings)
+
+    return {"retriever": retriever, "reranker": reranker}
+
+
 class TestMetadataFiltering:
     """Test reranking with metadata filtering."""
 
-    @pytest.mark.asyncio
-    async def test_rerank_with_filtered_results(self):
+    async def test_rerank_with_filtered_results(self, filtered_pipeline):
         """Test reranking on filtered retrieval results."""
-        # Setup
-        embedding_config = EmbeddingConfigV2(
-            provider="sentence_transformers",
-            model="all-MiniLM-L6-v2",
-        )
-
-        vectordb_config = VectorDBConfigV2(
-            provider="chromadb",
-            in_memory=True,
-            collection_name="test_filtered_rerank",
-        )
-
-        retrieval_config = RetrievalConfigV2(retrieval_mode="semantic")
-        reranking_config = RerankingConfigV2(
-            reranker_enabled=True,
-            reranker_model="cross-encoder/ms-marco-MiniLM-L-6-v2",
-            use_gpu=False,
-        )
-
-        # Components
-        embedder = AdvancedEmbedder(embedding_config)
-        vectordb = ChromaDBAdapter(vectordb_config)
-        retriever = SemanticRetriever(vectordb, embedder, retrieval_config)
-        reranker = CrossEncoderReranker(reranking_config)
-
-        # Documents with metadata
-        chunks = [
-            Chunk(
-                id="1",
-                content="API security in Python",
-                metadata={"language": "python"},
-            ),
-            Chunk(
-                id="2",
-                content="API security in JavaScript",
-                metadata={"language": "javascript"},
-            ),
-            Chunk(
-                id="3",
-                content="API security in Go",
-                metadata={"language": "go"},
-            ),
-        ]
-
-        texts = [c.content for c in chunks]
-        embeddings = await embedder.embed_batch(texts)
-        await vectordb.insert_batch(chunks, embeddings)
+        retriever = filtered_pipeline["retriever"]
+        reranker = filtered_pipeline["reranker"]
 
         # Retrieval with filter
         query = "API security"
@@ -4,11 +4,7 @@ from __future__ import annotations
 
 import pytest
 
-pytest.importorskip("torch")
-pytest.importorskip("sentence_transformers")
-
-from ragkit.config.schema_v2 import EmbeddingConfigV2, RetrievalConfigV2, VectorDBConfigV2
-from ragkit.embedding.advanced_embedder import AdvancedEmbedder
+from ragkit.config.schema_v2 import RetrievalConfigV2, VectorDBConfigV2
 from ragkit.models import Chunk
 from ragkit.retrieval.base_retriever import SearchResult
 from ragkit.retrieval.hybrid_retriever import HybridRetriever
@@ -16,19 +12,18 @@ from ragkit.retrieval.lexical_retriever import LexicalRetriever
 from ragkit.retrieval.semantic_retriever import SemanticRetriever
 from ragkit.retrieval.utils.fusion import linear_fusion, reciprocal_rank_fusion
 from ragkit.vectorstore.chromadb_adapter import ChromaDBAdapter
+from tests.helpers import requires_sentence_transformers
+
+pytestmark = requires_sentence_transformers
 
 
 class TestHybridRetrieval:
     """Tests for hybrid retrieval."""
 
     @pytest.fixture
-    async def hybrid_retriever(self):
+    async def hybrid_retriever(self, minilm_embedder):
         """Create hybrid retriever with test data."""
         # Configs
-        embedding_config = EmbeddingConfigV2(
-            provider="sentence_transformers",
-            model="all-MiniLM-L6-v2",
-        )
         vectordb_config = VectorDBConfigV2(
             provider="chromadb",
             in_memory=True,
@@ -41,10 +36,9 @@ class TestHybridRetrieval:
         )
 
         # Components
-        embedder = AdvancedEmbedder(embedding_config)
         vectordb = ChromaDBAdapter(vectordb_config)
 
-        semantic = SemanticRetriever(vectordb, embedder, retrieval_config)
+        semantic = SemanticRetriever(vectordb, minilm_embedder, retrieval_config)
         lexical = LexicalRetriever(retrieval_config)
 
         hybrid = HybridRetriever(semantic, lexical, retrieval_config)
@@ -70,7 +64,7 @@ class TestHybridRetrieval:
 
         # Index in both
         texts = [c.content for c in chunks]
-        embeddings = await embedder.embed_batch(texts)
+        embeddings = await minilm_embedder.embed_batch(texts)
         await vectordb.insert_batch(chunks, embeddings)
         lexical.index_documents(chunks)
 
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
+from rank_bm25 import BM25Okapi, BM25Plus
 
 from ragkit.config.schema_v2 import RetrievalConfigV2
 from ragkit.models import Chunk
 from ragkit.retrieval.lexical_retriever import LexicalRetriever
+from ragkit.retrieval.utils.bm25 import BM25Scorer
 
 
 class TestLexicalRetrieval:
@@ -120,11 +123,33 @@ class TestTokenization:
         assert len(results) == 2  # Both docs match (stopword ignored)
 
 
+class TestBM25Scorer:
+    """Tests for the postings-based BM25 scorer."""
+
+    @pytest.mark.parametrize(
+        "bm25_cls, params",
+        [(BM25Okapi, {"k1": 1.2, "b": 0.75}), (BM25Plus, {"k1": 1.5, "b": 0.5, "delta": 1.0})],
+    )
+    def test_scores_match_rank_bm25(self, bm25_cls, params):
+        """Scores are identical to rank_bm25, including repeated and unknown terms."""
+        corpus = [
+            ["python", "programming", "language"],
+            ["java", "programming", "python", "python"],
+            ["cooking", "recipes"],
+            ["python"],
+            ["machine", "learning", "with", "python", "and", "java"],
+        ]
+        bm25 = bm25_cls(corpus, **params)
+        scorer = BM25Scorer(bm25)
+
+        for query in (["python"], ["python", "python", "java"], ["unknown", "recipes"]):
+            np.testing.assert_array_equal(scorer.get_scores(query), bm25.get_scores(query))
+
+
 class TestBM25Parameters:
     """Tests for BM25 parameter tuning."""
 
-    @pytest.mark.asyncio
-    async def test_bm25_k1_impact(self):
+    def test_bm25_k1_impact(self):
         """k1 parameter affects term frequency saturation."""
         # Document with many occurrences of "python"
         chunks = [
@@ -132,24 +157,16 @@ class TestBM25Parameters:
             Chunk(id="2", content="python programming", metadata={}),
         ]
 
-        # Low k1: fast saturation
-        config_low = RetrievalConfigV2(bm25_k1=0.5)
-        retriever_low = LexicalRetriever(config_low)
-        retriever_low.index_documents(chunks)
-        results_low = await retriever_low.search("python")
-
-        # High k1: slow saturation (favors doc1 more)
-        config_high = RetrievalConfigV2(bm25_k1=2.0)
-        retriever_high = LexicalRetriever(config_high)
-        retriever_high.index_documents(chunks)
-        results_high = await retriever_high.search("python")
+        retriever = LexicalRetriever(RetrievalConfigV2())
+        retriever.index_documents(chunks)
 
-        # Both should return results
-        assert len(results_low) == 2
-        assert len(results_high) == 2
+        # One tokenized corpus, two saturation settings
+        query = retriever.tokenizer.tokenize("python")
+        scores_low = BM25Scorer(retriever.bm25, k1=0.5).get_scores(query)
+        scores_high = BM25Scorer(retriever.bm25, k1=2.0).get_scores(query)
 
-        # Scores should differ based on k1
-        # (exact comparison depends on BM25 implementation)
+        # High k1 saturates slower, so the repetitive doc gains on the short one
+        assert scores_high[0] / scores_high[1] > scores_low[0] / scores_low[1]
 
     @pytest.mark.asyncio
     async def test_metadata_filtering(self):
@@ -2,30 +2,70 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
+import pytest_asyncio
 
-pytest.importorskip("torch")
-pytest.importorskip("sentence_transformers")
-
-from ragkit.config.schema_v2 import EmbeddingConfigV2, RetrievalConfigV2, VectorDBConfigV2
-from ragkit.embedding.advanced_embedder import AdvancedEmbedder
+from ragkit.config.schema_v2 import RetrievalConfigV2, VectorDBConfigV2
 from ragkit.models import Chunk
 from ragkit.retrieval.semantic_retriever import SemanticRetriever
 from ragkit.vectorstore.chromadb_adapter import ChromaDBAdapter
+from tests.helpers import requires_sentence_transformers
+
+pytestmark = requires_sentence_transformers
+
+SEMANTIC_CHUNKS = [
+    Chunk(
+        id="1",
+        content="Python is a high-level programming language",
+        metadata={"source": "doc1"},
+    ),
+    Chunk(
+        id="2",
+        content="Java is also a popular programming language",
+        metadata={"source": "doc2"},
+    ),
+    Chunk(id="3", content="Cats are cute animals", metadata={"source": "doc3"}),
+]
+
+FILTER_CHUNKS = [
+    Chunk(
+        id="1",
+        content="Python doc chapter 1",
+        metadata={"source": "manual.pdf"},
+    ),
+    Chunk(
+        id="2",
+        content="Python doc chapter 2",
+        metadata={"source": "manual.pdf"},
+    ),
+    Chunk(
+        id="3",
+        content="Python tutorial",
+        metadata={"source": "tutorial.pdf"},
+    ),
+]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def corpus_embeddings(minilm_embedder):
+    """Embeddings of every chunk in this module, keyed by content.
+
+    All corpora go through the model in a single batch: for a local model one
+    large batch is cheaper than several small ones.
+    """
+    texts = [chunk.content for chunk in SEMANTIC_CHUNKS + FILTER_CHUNKS]
+    embeddings = await minilm_embedder.embed_batch(texts)
+    return dict(zip(texts, embeddings, strict=True))
 
 
 class TestSemanticRetrieval:
     """Tests for semantic retrieval."""
 
     @pytest.fixture
-    async def retriever(self):
+    async def retriever(self, minilm_embedder, corpus_embeddings):
         """Create semantic retriever with test data."""
         # Config
-        embedding_config = EmbeddingConfigV2(
-            provider="sentence_transformers",
-            model="all-MiniLM-L6-v2",
-            cache_embeddings=False,
-        )
         vectordb_config = VectorDBConfigV2(
             provider="chromadb",
             in_memory=True,
@@ -36,29 +76,12 @@ class TestSemanticRetrieval:
         )
 
         # Components
-        embedder = AdvancedEmbedder(embedding_config)
         vectordb = ChromaDBAdapter(vectordb_config)
-        retriever = SemanticRetriever(vectordb, embedder, retrieval_config)
+        retriever = SemanticRetriever(vectordb, minilm_embedder, retrieval_config)
 
         # Index test documents
-        chunks = [
-            Chunk(
-                id="1",
-                content="Python is a high-level programming language",
-                metadata={"source": "doc1"},
-            ),
-            Chunk(
-                id="2",
-                content="Java is also a popular programming language",
-                metadata={"source": "doc2"},
-            ),
-            Chunk(id="3", content="Cats are cute animals", metadata={"source": "doc3"}),
-        ]
-
-        # Embed and index
-        texts = [c.content for c in chunks]
-        embeddings = await embedder.embed_batch(texts)
-        await vectordb.insert_batch(chunks, embeddings)
+        embeddings = np.array([corpus_embeddings[c.content] for c in SEMANTIC_CHUNKS])
+        await vectordb.insert_batch(SEMANTIC_CHUNKS, embeddings)
 
         return retriever
 
@@ -112,13 +135,9 @@ class TestMetadataFiltering:
     """Tests for metadata filtering."""
 
     @pytest.mark.asyncio
-    async def test_filter_by_source(self):
+    async def test_filter_by_source(self, minilm_embedder, corpus_embeddings):
         """Metadata filters work correctly."""
         # Setup
-        embedding_config = EmbeddingConfigV2(
-            provider="sentence_transformers",
-            model="all-MiniLM-L6-v2",
-        )
         vectordb_config = VectorDBConfigV2(
             provider="chromadb",
             in_memory=True,
@@ -126,32 +145,12 @@ class TestMetadataFiltering:
         )
         retrieval_config = RetrievalConfigV2()
 
-        embedder = AdvancedEmbedder(embedding_config)
         vectordb = ChromaDBAdapter(vectordb_config)
-        retriever = SemanticRetriever(vectordb, embedder, retrieval_config)
+        retriever = SemanticRetriever(vectordb, minilm_embedder, retrieval_config)
 
         # Index documents
-        chunks = [
-            Chunk(
-                id="1",
-                content="Python doc chapter 1",
-                metadata={"source": "manual.pdf"},
-            ),
-            Chunk(
-                id="2",
-                content="Python doc chapter 2",
-                metadata={"source": "manual.pdf"},
-            ),
-            Chunk(
-                id="3",
-                content="Python tutorial",
-                metadata={"source": "tutorial.pdf"},
-            ),
-        ]
-
-        texts = [c.content for c in chunks]
-        embeddings = await embedder.embed_batch(texts)
-        await vectordb.insert_batch(chunks, embeddings)
+        embeddings = np.array([corpus_embeddings[c.content] for c in FILTER_CHUNKS])
+        await vectordb.insert_batch(FILTER_CHUNKS, embeddings)
 
         # Search with filter
         results = await retriever.search("Python", top_k=10, filters={"source": "manual.pdf"})
@@ -1,7 +1,11 @@
 """Tests for semantic query cache matching."""
 
+import time
+from types import SimpleNamespace
+
 import pytest
 
+from ragkit.cache import semantic_matcher
 from ragkit.cache.query_cache import QueryCache
 from ragkit.cache.semantic_matcher import SemanticMatcher
 from ragkit.config.schema_v2 import CacheConfigV2
@@ -29,3 +33,63 @@ async def test_semantic_cache_hits_similar_queries():
     cached = await cache.get("How to protect API endpoints?")
 
     assert cached == "answer-1"
+
+
+@pytest.mark.asyncio
+async def test_semantic_matcher_returns_most_similar_entry(monkeypatch):
+    config = CacheConfigV2(semantic_cache_threshold=0.4, cache_backend="memory")
+    vectors = {
+        "a": [1.0, 0.0, 0.0],
+        "b": [0.6, 0.8, 0.0],
+        "c": [0.0, 0.0, 3.0],
+        "query": [0.5, 1.0, 0.0],
+        "other": [0.0, -1.0, 0.0],
+    }
+
+    def embedder(texts):
+        return [vectors[text] for text in texts]
+
+    matcher = SemanticMatcher(config, embedder=embedder)
+    for key in ("a", "b", "c"):
+        await matcher.add(key, key, ttl=None)
+
+    assert await matcher.find("query") == "b"
+    assert await matcher.find("other") is None
+
+    # Re-adding a key replaces its embedding in place
+    await matcher.add("b", "c", ttl=None)
+    assert await matcher.find("query") == "a"
+
+    # Expired entries no longer match
+    await matcher.add("a", "a", ttl=10)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 60)
+    assert await matcher.find("query") is None
+    assert await matcher.find("c") == "b"
+
+
+@pytest.mark.asyncio
+async def test_semantic_matcher_grows_and_compacts_rows(monkeypatch):
+    config = CacheConfigV2(semantic_cache_threshold=0.99, cache_backend="memory")
+
+    def embedder(texts):
+        return [[1.0, float(text)] for text in texts]
+
+    clock = [100.0]
+    monkeypatch.setattr(semantic_matcher, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    matcher = SemanticMatcher(config, embedder=embedder)
+    for i in range(10):
+        await matcher.add(f"k{i}", str(i), ttl=10 if i % 2 else None)
+
+    assert [await matcher.find(str(i)) for i in range(10)] == [f"k{i}" for i in range(10)]
+
+    # Expired odd rows are purged; the even rows keep matching after compaction
+    clock[0] += 20
+    assert [await matcher.find(str(i)) for i in range(0, 10, 2)] == [
+        f"k{i}" for i in range(0, 10, 2)
+    ]
+    assert await matcher.find("1") is None
+
+    await matcher.add("k1", "1", ttl=None)
+    assert await matcher.find("1") == "k1"
+    assert await matcher.find("8") == "k8"
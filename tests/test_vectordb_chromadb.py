@@ -10,6 +10,21 @@ from ragkit.models import Chunk
 from ragkit.vectorstore.chromadb_adapter import ChromaDBAdapter
 
 
+@pytest.fixture
+def rng():
+    """Seeded generator so the random embeddings are the same on every run."""
+    return np.random.default_rng(0)
+
+
+@pytest.fixture(autouse=True)
+def _drop_collections(chroma_client):
+    """Give every test empty collections on the shared client."""
+    yield
+    for collection in chroma_client.list_collections():
+        # Chroma 0.6 lists collection names, other versions Collection objects
+        chroma_client.delete_collection(getattr(collection, "name", collection))
+
+
 class TestChromaDBInsertion:
     """Tests for ChromaDB insertion."""
 
@@ -23,12 +38,12 @@ class TestChromaDBInsertion:
         )
 
     @pytest.fixture
-    def adapter(self, config):
+    def adapter(self, config, chroma_client):
         """ChromaDB adapter."""
-        return ChromaDBAdapter(config)
+        return ChromaDBAdapter(config, client=chroma_client)
 
     @pytest.mark.asyncio
-    async def test_insert_and_search(self, adapter):
+    async def test_insert_and_search(self, adapter, rng):
         """Verify basic insertion and search."""
         # Chunks
         chunks = [
@@ -38,13 +53,13 @@ class TestChromaDBInsertion:
         ]
 
         # Embeddings (fake, 384 dims)
-        embeddings = np.random.rand(3, 384).astype(np.float32)
+        embeddings = rng.random((3, 384), dtype=np.float32)
 
         # Insertion
         await adapter.insert_batch(chunks, embeddings)
 
         # Search with query similar to first chunk
-        query_embedding = embeddings[0] + np.random.rand(384) * 0.01
+        query_embedding = embeddings[0] + rng.random(384, dtype=np.float32) * 0.01
 
         results = await adapter.search(query_embedding, top_k=3)
 
@@ -55,7 +70,7 @@ class TestChromaDBInsertion:
         assert "Python" in results[0][0].content
 
     @pytest.mark.asyncio
-    async def test_search_with_filters(self, adapter):
+    async def test_search_with_filters(self, adapter, rng):
         """Verify search with filters."""
         # Chunks
         chunks = [
@@ -64,7 +79,7 @@ class TestChromaDBInsertion:
             Chunk(content="Python tutorial", metadata={"source": "tutorial.pdf", "page": 1}),
         ]
 
-        embeddings = np.random.rand(3, 384).astype(np.float32)
+        embeddings = rng.random((3, 384), dtype=np.float32)
 
         await adapter.insert_batch(chunks, embeddings)
 
@@ -78,12 +93,32 @@ class TestChromaDBInsertion:
         for chunk, _score in results:
             assert chunk.metadata["source"] == "manual.pdf"
 
+    @pytest.mark.asyncio
+    async def test_insert_batch_larger_than_client_limit(self, chroma_client, rng):
+        """A configured batch_size above Chroma's add() limit is clamped."""
+        config = VectorDBConfigV2(
+            in_memory=True,
+            collection_name="test_large_batch",
+            batch_size=10000,
+        )
+        adapter = ChromaDBAdapter(config, client=chroma_client)
+        total = adapter.client.get_max_batch_size() + 10
+
+        chunks = [
+            Chunk(content=f"Document {i}", metadata={"chunk_id": str(i)}) for i in range(total)
+        ]
+        embeddings = rng.random((total, 8), dtype=np.float32)
+
+        await adapter.insert_batch(chunks, embeddings)
+
+        assert adapter.collection.count() == total
+
 
 class TestHNSWParameters:
     """Tests for HNSW parameters."""
 
     @pytest.mark.asyncio
-    async def test_hnsw_ef_search_impact(self):
+    async def test_hnsw_ef_search_impact(self, chroma_client, rng):
         """Verify impact of hnsw_ef_search on recall."""
         # Configuration with low ef_search
         config_low = VectorDBConfigV2(
@@ -99,12 +134,12 @@ class TestHNSWParameters:
             hnsw_ef_search=200,
         )
 
-        adapter_low = ChromaDBAdapter(config_low)
-        adapter_high = ChromaDBAdapter(config_high)
+        adapter_low = ChromaDBAdapter(config_low, client=chroma_client)
+        adapter_high = ChromaDBAdapter(config_high, client=chroma_client)
 
-        # Insert 1000 chunks
-        chunks = [Chunk(content=f"Document {i}", metadata={"id": i}) for i in range(1000)]
-        embeddings = np.random.rand(1000, 384).astype(np.float32)
+        # A small corpus still exercises the HNSW graph
+        chunks = [Chunk(content=f"Document {i}", metadata={"id": i}) for i in range(128)]
+        embeddings = rng.random((128, 384), dtype=np.float32)
 
         await adapter_low.insert_batch(chunks, embeddings)
         await adapter_high.insert_batch(chunks, embeddings)
@@ -118,4 +153,4 @@ class TestHNSWParameters:
         # High ef_search should give better results
         # (approximate measure: top 1 score)
         assert len(results_low) > 0
-        assert len(results_high) > 0
+        assert results_high[0][0].metadata["id"] == 0
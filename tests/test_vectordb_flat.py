@@ -0,0 +1,60 @@
+"""Tests for the flat NumPy vector adapter."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from ragkit.config.schema_v2 import VectorDBConfigV2
+from ragkit.models import Chunk
+from ragkit.vectorstore.flat_adapter import FlatVectorAdapter
+
+
+def _chunks(n: int) -> list[Chunk]:
+    return [Chunk(id=f"c{i}", content=f"chunk {i}", metadata={"parity": i % 2}) for i in range(n)]
+
+
+class TestFlatVectorAdapter:
+    """Tests for exact search."""
+
+    async def test_empty_search(self):
+        adapter = FlatVectorAdapter(VectorDBConfigV2(provider="flat"))
+        assert await adapter.search(np.ones(4), top_k=3) == []
+
+    @pytest.mark.parametrize("metric", ["cosine", "dot_product", "euclidean"])
+    async def test_matches_brute_force(self, metric):
+        """Top-k matches a full numpy ranking, across several inserts."""
+        rng = np.random.default_rng(0)
+        embeddings = rng.normal(size=(40, 8)).astype(np.float32)
+        query = rng.normal(size=8).astype(np.float32)
+        chunks = _chunks(40)
+
+        adapter = FlatVectorAdapter(VectorDBConfigV2(provider="flat", distance_metric=metric))
+        await adapter.insert_batch(chunks[:25], embeddings[:25])
+        await adapter.insert_batch(chunks[25:], embeddings[25:])
+
+        results = await adapter.search(query, top_k=5)
+
+        if metric == "cosine":
+            unit = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+            expected = unit @ (query / np.linalg.norm(query))
+        elif metric == "dot_product":
+            expected = embeddings @ query
+        else:
+            expected = -np.square(embeddings - query).sum(axis=1)
+
+        assert [chunk.id for chunk, _ in results] == [f"c{i}" for i in np.argsort(-expected)[:5]]
+        np.testing.assert_allclose(
+            [score for _, score in results], np.sort(expected)[::-1][:5], rtol=1e-5
+        )
+
+    async def test_filters(self):
+        """Only chunks whose metadata matches every filter are returned."""
+        adapter = FlatVectorAdapter(VectorDBConfigV2(provider="flat"))
+        await adapter.insert_batch(_chunks(10), np.random.default_rng(1).normal(size=(10, 4)))
+
+        results = await adapter.search(np.ones(4), top_k=10, filters={"parity": 1})
+
+        assert len(results) == 5
+        assert all(chunk.metadata["parity"] == 1 for chunk, _ in results)
+        assert await adapter.search(np.ones(4), filters={"missing": 1}) == []
@@ -5,14 +5,16 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from ragkit.config import wizard as wizard_module
-from ragkit.config.profiles import get_profile_description, get_profile_for_answers
+from ragkit.config.profiles import PROFILES, get_profile_description, get_profile_for_answers
 from ragkit.desktop.wizard_api import router as wizard_router
 
 
-def _create_app() -> FastAPI:
+@pytest.fixture(scope="module")
+def client():
     app = FastAPI()
     app.include_router(wizard_router, prefix="/api")
-    return app
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 def test_profile_base_configuration():
@@ -32,6 +34,25 @@ def test_profile_base_configuration():
     assert profile["reranking"]["enabled"] is True
 
 
+def test_profile_mutation_does_not_leak_into_profiles():
+    answers = {
+        "has_tables": False,
+        "needs_multi_doc": False,
+        "large_docs": False,
+        "needs_precision": False,
+        "frequent_updates": False,
+        "cite_pages": False,
+    }
+    profile = get_profile_for_answers(kb_type="faq_support", **answers)
+    profile["chunking"]["chunk_size"] = 1
+    profile["reranking"]["enabled"] = True
+
+    assert PROFILES["faq_support"]["chunking"]["chunk_size"] == 256
+    assert get_profile_for_answers(kb_type="faq_support", **answers)["reranking"] == {
+        "enabled": False
+    }
+
+
 def test_profile_with_large_documents():
     profile = get_profile_for_answers(
         kb_type="technical_documentation",
@@ -202,9 +223,7 @@ def test_format_parsing_summary_ocr_images():
     assert "images" in summary
 
 
-def test_analyze_profile_endpoint():
-    client = TestClient(_create_app())
-
+def test_analyze_profile_endpoint(client):
     response = client.post(
         "/api/wizard/analyze-profile",
         json={
@@ -233,9 +252,7 @@ def test_analyze_profile_endpoint():
     assert config["metadata"]["add_page_numbers"] is True
 
 
-def test_environment_detection_endpoint():
-    client = TestClient(_create_app())
-
+def test_environment_detection_endpoint(client):
     response = client.get("/api/wizard/environment-detection")
 
     assert response.status_code == 200
@@ -248,9 +265,7 @@ def test_environment_detection_endpoint():
     assert "running" in data["ollama"]
 
 
-def test_analyze_profile_invalid_kb_type():
-    client = TestClient(_create_app())
-
+def test_analyze_profile_invalid_kb_type(client):
     response = client.post(
         "/api/wizard/analyze-profile",
         json={
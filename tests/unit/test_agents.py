@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from ragkit.agents.orchestrator import AgentOrchestrator
@@ -180,3 +182,108 @@ async def test_agent_orchestrator_flow():
 
     assert result.response.content == "Paris"
     assert result.context is not None
+
+
+class _SlowLLM(DummyLLM):
+    async def complete_json(self, messages, schema):
+        await asyncio.sleep(0.05)
+        return await super().complete_json(messages, schema)
+
+
+class _SlowRetrieval(DummyRetrieval):
+    def __init__(self):
+        self.queries: list[str] = []
+        self.completed = 0
+
+    async def retrieve(self, query):
+        self.queries.append(query)
+        await asyncio.sleep(0.05)
+        self.completed += 1
+        return await super().retrieve(query)
+
+
+def _speculative_config() -> AgentsConfig:
+    return AgentsConfig(
+        mode="default",
+        query_analyzer=QueryAnalyzerConfig(
+            llm="fast",
+            behavior=QueryAnalyzerBehaviorConfig(
+                detect_intents=["question", "greeting"],
+                query_rewriting=QueryRewritingConfig(enabled=False),
+            ),
+            system_prompt="prompt",
+            output_schema={},
+        ),
+        response_generator=ResponseGeneratorConfig(
+            llm="primary",
+            behavior=ResponseBehaviorConfig(),
+            system_prompt="Context:\n{context}",
+            no_retrieval_prompt="Hi",
+            out_of_scope_prompt="Out",
+        ),
+        global_config=AgentsGlobalConfig(),
+    )
+
+
+class _OrderedRetrieval(DummyRetrieval):
+    def __init__(self, events: list[str]):
+        self.events = events
+        self.queries: list[str] = []
+        self.started = asyncio.Event()
+
+    async def retrieve(self, query):
+        self.queries.append(query)
+        self.events.append("retrieval started")
+        self.started.set()
+        return await super().retrieve(query)
+
+
+class _OrderedLLM(DummyLLM):
+    def __init__(self, retrieval: _OrderedRetrieval, **kwargs):
+        super().__init__(**kwargs)
+        self.retrieval = retrieval
+
+    async def complete_json(self, messages, schema):
+        # Give a concurrent retrieval the chance to start; a sequential one
+        # only starts after this returns, so the wait times out.
+        try:
+            await asyncio.wait_for(self.retrieval.started.wait(), timeout=1)
+        except asyncio.TimeoutError:
+            pass
+        self.retrieval.events.append("analysis returned")
+        return await super().complete_json(messages, schema)
+
+
+@pytest.mark.asyncio
+async def test_agent_orchestrator_retrieves_during_analysis():
+    events: list[str] = []
+    retrieval = _OrderedRetrieval(events)
+    llm = _OrderedLLM(
+        retrieval,
+        json_response={"intent": "question", "needs_retrieval": True, "reasoning": "test"},
+        text_response="Paris",
+    )
+    orchestrator = AgentOrchestrator(_speculative_config(), retrieval, DummyRouter(llm))
+
+    result = await orchestrator.process("What is capital?")
+
+    assert result.context is not None
+    assert retrieval.queries == ["What is capital?"]
+    assert events == ["retrieval started", "analysis returned"]
+
+
+@pytest.mark.asyncio
+async def test_agent_orchestrator_cancels_unneeded_retrieval():
+    llm = _SlowLLM(
+        json_response={"intent": "greeting", "needs_retrieval": False, "reasoning": "hi"},
+        text_response="Hello",
+    )
+    retrieval = _SlowRetrieval()
+    orchestrator = AgentOrchestrator(_speculative_config(), retrieval, DummyRouter(llm))
+
+    result = await orchestrator.process("Bonjour")
+    await asyncio.sleep(0.1)
+
+    assert result.context is None
+    assert retrieval.queries == ["Bonjour"]
+    assert retrieval.completed == 0
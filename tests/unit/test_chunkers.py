@@ -1,4 +1,7 @@
+import pytest
+
 from ragkit.config.schema import SemanticChunkingConfig
+from ragkit.ingestion.chunkers import fixed
 from ragkit.ingestion.chunkers.fixed import FixedChunker
 from ragkit.ingestion.chunkers.semantic import SemanticChunker
 from ragkit.ingestion.parsers.base import ParsedDocument
@@ -31,3 +34,51 @@ def test_semantic_chunker_fallback():
     chunks = chunker.chunk(doc)
 
     assert len(chunks) >= 1
+
+
+def test_semantic_chunker_splits_on_topic_change():
+    class TopicEmbedder:
+        def __init__(self):
+            self.calls = []
+
+        def embed_texts(self, texts):
+            self.calls.append(texts)
+            return [[1.0, 0.0] if "cat" in text else [0.0, 2.0] for text in texts]
+
+    doc = ParsedDocument(
+        content="A cat sat. The cat slept. Stocks rose. Stocks fell.",
+        metadata={"document_id": "doc3"},
+    )
+    config = SemanticChunkingConfig(
+        similarity_threshold=0.5,
+        min_chunk_size=1,
+        max_chunk_size=100,
+        embedding_model="document_model",
+    )
+    embedder = TopicEmbedder()
+    chunks = SemanticChunker(config, embedder=embedder).chunk(doc)
+
+    assert len(embedder.calls) == 1
+    assert [chunk.content for chunk in chunks] == [
+        "A cat sat. The cat slept.",
+        "Stocks rose. Stocks fell.",
+    ]
+
+
+def test_tokenizer_lookup_failure_is_not_retried(monkeypatch):
+    tiktoken = pytest.importorskip("tiktoken")
+    calls = []
+
+    def failing_get_encoding(name):
+        calls.append(name)
+        raise OSError("no network")
+
+    monkeypatch.setattr(tiktoken, "get_encoding", failing_get_encoding)
+    fixed._encoding.cache_clear()
+    try:
+        results = [fixed._tokenize(text) for text in ("one two", "three", "four five six")]
+    finally:
+        fixed._encoding.cache_clear()
+
+    assert calls == ["cl100k_base"]
+    assert results[2] == (["four", "five", "six"], None)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from difflib import SequenceMatcher
+
 from ragkit.ingestion.deduplication import DocumentDeduplicator
 
 
@@ -38,6 +40,28 @@ class TestDocumentDeduplicator:
         dedup.register("The quick brown fox jumps over the lazy dog")
         assert dedup.is_duplicate("A completely different text about something else") is False
 
+    def test_fuzzy_dedup_matches_full_ratio(self):
+        registered = [
+            "The quick brown fox jumps over the lazy dog",
+            "The quick brown fox",
+            "Lorem ipsum dolor sit amet, consectetur adipiscing elit " * 3,
+        ]
+        queries = [
+            "The quick brown fox jumps over the lazy cat",
+            "The quick brown fax",
+            "Lorem ipsum dolor sit amet, consectetur adipiscing elit " * 2,
+            "unrelated",
+        ]
+        for threshold in (0.5, 0.8, 0.95):
+            dedup = DocumentDeduplicator(strategy="fuzzy", threshold=threshold)
+            for text in registered:
+                dedup.register(text)
+            for query in queries:
+                expected = any(
+                    SequenceMatcher(None, query, text).ratio() >= threshold for text in registered
+                )
+                assert dedup.is_duplicate(query) is expected
+
     def test_none_strategy_never_detects(self):
         dedup = DocumentDeduplicator(strategy="none")
         dedup.register("test content")
@@ -79,3 +103,22 @@ class TestDocumentDeduplicator:
         h1 = DocumentDeduplicator._exact_hash("hello world")
         h2 = DocumentDeduplicator._exact_hash("goodbye world")
         assert h1 != h2
+
+    def test_check_then_register_hashes_once(self, monkeypatch):
+        calls: list[str] = []
+        exact_hash = DocumentDeduplicator._exact_hash
+
+        def counting_hash(content: str) -> str:
+            calls.append(content)
+            return exact_hash(content)
+
+        monkeypatch.setattr(DocumentDeduplicator, "_exact_hash", staticmethod(counting_hash))
+        dedup = DocumentDeduplicator(strategy="exact")
+        content = "first document"
+
+        assert dedup.is_duplicate(content) is False
+        dedup.register(content)
+        dedup.register("second document")
+
+        assert calls == ["first document", "second document"]
+        assert dedup.is_duplicate("first   document") is True
@@ -1,6 +1,9 @@
+import asyncio
+
 import pytest
 
 from ragkit.embedding.base import BaseEmbedder
+from ragkit.embedding.batching import BatchedEmbedder
 from ragkit.embedding.cache import CachedEmbedder, EmbeddingCache
 
 
@@ -21,6 +24,26 @@ class DummyEmbedder(BaseEmbedder):
         return [0.5, 0.5, 0.5]
 
 
+class SlowEmbedder(DummyEmbedder):
+    def __init__(self, fail: bool = False) -> None:
+        super().__init__()
+        self.fail = fail
+        self.embedded: list[str] = []
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        self.embedded.extend(texts)
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("provider down")
+        return await super().embed(texts)
+
+    async def embed_query(self, query: str) -> list[float]:
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("provider down")
+        return await super().embed_query(query)
+
+
 @pytest.mark.asyncio
 async def test_embedding_cache_memory():
     cache = EmbeddingCache(backend="memory", ttl=3600)
@@ -49,3 +72,89 @@ async def test_embedding_cache_query():
     result2 = await cached.embed_query("query")
     assert result2 == [0.5, 0.5, 0.5]
     assert embedder.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_embedding_cache_shares_inflight_queries():
+    embedder = SlowEmbedder()
+    cached = CachedEmbedder(embedder, EmbeddingCache(backend="memory"))
+
+    results = await asyncio.gather(*(cached.embed_query("query") for _ in range(5)))
+
+    assert results == [[0.5, 0.5, 0.5]] * 5
+    assert embedder.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_embedding_cache_shares_inflight_texts():
+    embedder = SlowEmbedder()
+    cached = CachedEmbedder(embedder, EmbeddingCache(backend="memory"))
+
+    first, second = await asyncio.gather(
+        cached.embed(["a", "b", "a"]),
+        cached.embed(["b", "c"]),
+    )
+
+    assert first == [[1.0, 0.0, 0.0]] * 3
+    assert second == [[1.0, 0.0, 0.0]] * 2
+    assert sorted(embedder.embedded) == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_embedding_cache_inflight_failure_reaches_waiters():
+    embedder = SlowEmbedder(fail=True)
+    cached = CachedEmbedder(embedder, EmbeddingCache(backend="memory"))
+
+    results = await asyncio.gather(
+        cached.embed_query("query"), cached.embed_query("query"), return_exceptions=True
+    )
+
+    assert [str(result) for result in results] == ["provider down"] * 2
+    embedder.fail = False
+    assert await cached.embed_query("query") == [0.5, 0.5, 0.5]
+
+
+@pytest.mark.asyncio
+async def test_embedding_cache_owner_cancellation_spares_waiters():
+    embedder = SlowEmbedder()
+    cached = CachedEmbedder(embedder, EmbeddingCache(backend="memory"))
+
+    owner = asyncio.create_task(cached.embed_query("query"))
+    query_waiter = asyncio.create_task(cached.embed_query("query"))
+    owner_texts = asyncio.create_task(cached.embed(["a", "b"]))
+    texts_waiter = asyncio.create_task(cached.embed(["b", "c"]))
+    await asyncio.sleep(0)
+    owner.cancel()
+    owner_texts.cancel()
+
+    assert await query_waiter == [0.5, 0.5, 0.5]
+    assert await texts_waiter == [[1.0, 0.0, 0.0]] * 2
+    assert owner.cancelled() and owner_texts.cancelled()
+    # The waiters embedded the abandoned texts themselves
+    assert embedder.embedded.count("b") == 2
+
+
+@pytest.mark.asyncio
+async def test_batched_embedder_coalesces_concurrent_calls():
+    embedder = SlowEmbedder()
+    batched = BatchedEmbedder(embedder, max_batch_size=8, max_wait_ms=20)
+
+    results = await asyncio.gather(
+        batched.embed(["a", "b"]), batched.embed(["c"]), batched.embed(["d"])
+    )
+    await batched.aclose()
+
+    assert results == [[[1.0, 0.0, 0.0]] * 2, [[1.0, 0.0, 0.0]], [[1.0, 0.0, 0.0]]]
+    assert embedder.call_count == 1
+    assert embedder.embedded == ["a", "b", "c", "d"]
+
+
+@pytest.mark.asyncio
+async def test_batched_embedder_respects_max_batch_size():
+    embedder = SlowEmbedder()
+    batched = BatchedEmbedder(embedder, max_batch_size=2, max_wait_ms=20)
+
+    assert len(await batched.embed(["a", "b", "c", "d", "e"])) == 5
+    await batched.aclose()
+
+    assert embedder.call_count == 3
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import langdetect
+
 from ragkit.ingestion.metadata import DocumentMetadata
 from ragkit.ingestion.metadata_extractor import MetadataExtractor
 from ragkit.ingestion.parsers.base import DocumentSection, ParsedDocument
@@ -158,6 +160,21 @@ class TestMetadataExtractor:
         meta = extractor.extract(raw, parsed)
         assert meta.language is None
 
+    def test_language_detection_samples_long_text(self, monkeypatch):
+        seen: list[str] = []
+
+        def fake_detect(text):
+            seen.append(text)
+            return "en"
+
+        monkeypatch.setattr(langdetect, "detect", fake_detect)
+        extractor = MetadataExtractor()
+        parsed = self._make_parsed("English words. " * 1000)
+
+        meta = extractor.extract(self._make_raw("doc.txt"), parsed)
+        assert meta.language == "en"
+        assert seen == [parsed.content[:2000]]
+
     def test_content_counting(self):
         extractor = MetadataExtractor()
         raw = self._make_raw("doc.md")
@@ -63,6 +63,8 @@ def test_get_summary(collector):
     assert summary.queries.success == 1
     assert summary.queries.failed == 1
     assert summary.queries.avg_latency_ms == 150.0
+    assert summary.queries.p95_latency_ms == 200.0
+    assert summary.queries.by_intent == {"question": 2}
 
 
 def test_record_ingestion(collector):
@@ -78,16 +80,23 @@ def test_record_ingestion(collector):
     assert summary.ingestion.total_runs == 1
     assert summary.ingestion.total_documents == 10
     assert summary.ingestion.total_chunks == 50
+    assert summary.ingestion.avg_duration_seconds == 3.5
+    assert summary.ingestion.last_run is not None
 
 
 def test_record_component_call(collector):
     collector.record_component_call("embedder", latency_ms=45.0, success=True)
     collector.record_component_call("embedder", latency_ms=55.0, success=False, error="timeout")
+    collector.record_component_call("embedder", latency_ms=20.0, success=False, error="refused")
+    collector.record_component_call("retrieval", latency_ms=5.0, success=True)
 
     summary = collector.get_summary("24h")
-    assert "embedder" in summary.components
-    assert summary.components["embedder"].calls == 2
-    assert summary.components["embedder"].errors == 1
+    assert set(summary.components) == {"embedder", "retrieval"}
+    assert summary.components["embedder"].calls == 3
+    assert summary.components["embedder"].errors == 2
+    assert summary.components["embedder"].avg_latency_ms == 40.0
+    assert summary.components["embedder"].last_error == "refused"
+    assert summary.components["retrieval"].last_error is None
 
 
 def test_timeseries(collector):
@@ -105,3 +114,26 @@ def test_empty_summary(collector):
     assert summary.queries.total == 0
     assert summary.ingestion.total_runs == 0
     assert summary.components == {}
+
+
+def test_connection_opens_lazily_and_reopens_after_close(tmp_path):
+    db_path = tmp_path / "nested" / "metrics.db"
+    collector = MetricsCollector(db_path=db_path)
+    assert not db_path.parent.exists()
+
+    collector.record_query("q1", latency_ms=10.0, success=True)
+    collector.close()
+    collector.close()
+    collector.record_query("q2", latency_ms=10.0, success=True)
+
+    assert [log["query"] for log in collector.get_query_logs()] == ["q2", "q1"]
+
+
+def test_connection_is_reopened_after_fork(collector):
+    collector.record_query("parent", latency_ms=10.0, success=True)
+    inherited = collector._conn
+    collector._pid = -1  # as seen from a forked child
+
+    assert collector.get_query_logs()[0]["query"] == "parent"
+    assert collector._conn is not inherited
+    inherited.execute("SELECT 1")  # the parent's connection is left open
@@ -31,6 +31,22 @@ Content of section 2.
     assert len(result.structure) >= 2
 
 
+@pytest.mark.asyncio
+async def test_markdown_parser_splits_sections_on_headings():
+    content = "Intro\r\n# Title\r\n#\r\nnot a heading\r\n## Empty\r\n### Last  \r\nBody\r\n  more"
+    raw_doc = RawDocument(content=content, source_path="doc.md", file_type="md", metadata={})
+    result = await MarkdownParser(ParsingConfig()).parse(raw_doc)
+
+    assert result.content == content
+    assert result.structure is not None
+    assert [(s.title, s.level, s.content) for s in result.structure] == [
+        (None, None, "Intro"),
+        ("Title", 1, "#\nnot a heading"),
+        ("Empty", 2, ""),
+        ("Last", 3, "Body\n  more"),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_text_parser_decodes_bytes():
     raw_doc = RawDocument(
@@ -1,5 +1,6 @@
 """Tests for ragkit.state.store."""
 
+import sqlite3
 from datetime import datetime, timezone
 
 import pytest
@@ -8,8 +9,8 @@ from ragkit.state.store import StateStore
 
 
 @pytest.fixture
-def store(tmp_path):
-    return StateStore(db_path=tmp_path / "test_state.db")
+def store():
+    return StateStore(db_path=":memory:")
 
 
 def test_get_default(store):
@@ -83,3 +84,21 @@ def test_ingestion_run_with_timestamps(store):
     history = store.get_ingestion_history(limit=1)
     assert history[0]["started_at"] == started.isoformat()
     assert history[0]["completed_at"] == completed.isoformat()
+
+
+def test_state_persists_across_instances(tmp_path):
+    db_path = tmp_path / "state.db"
+    StateStore(db_path=db_path).set("key", "value")
+    assert StateStore(db_path=db_path).get("key") == "value"
+
+
+def test_close_keeps_written_state(tmp_path):
+    db_path = tmp_path / "state.db"
+    store = StateStore(db_path=db_path)
+    store.set("key", "value")
+    store.close()
+    store.close()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        store.get("key")
+    assert StateStore(db_path=db_path).get("key") == "value"
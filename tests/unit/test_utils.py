@@ -1,8 +1,7 @@
-import asyncio
-
 from ragkit.config.schema import LoggingConfig, MetricsConfig, ObservabilityConfig
 from ragkit.models import Document
 from ragkit.utils.async_utils import retry_async
+from ragkit.utils.locks import KeyedLocks
 from ragkit.utils.logging import setup_logging
 
 
@@ -15,8 +14,14 @@ def test_logging_setup() -> None:
     assert logger is not None
 
 
-def test_retry_async() -> None:
+async def test_retry_async(monkeypatch) -> None:
     call_count = 0
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr("ragkit.utils.async_utils._sleep", fake_sleep)
 
     async def failing_func():
         nonlocal call_count
@@ -25,11 +30,23 @@ def test_retry_async() -> None:
             raise Exception("Temporary error")
         return "success"
 
-    result = asyncio.run(retry_async(failing_func, max_retries=3, delay=0.01))
+    result = await retry_async(failing_func, max_retries=3, delay=0.01)
     assert result == "success"
     assert call_count == 3
+    assert delays == [0.01, 0.01]
 
 
 def test_document_model() -> None:
     doc = Document(id="doc1", content="Test content", metadata={"source": "test.pdf"})
     assert doc.id == "doc1"
+
+
+def test_keyed_locks_are_per_key() -> None:
+    locks = KeyedLocks()
+    assert locks(("a", "cpu")) is locks(("a", "cpu"))
+
+    with locks(("a", "cpu")):
+        # Another key is free while the first is held
+        other = locks(("b", "cpu"))
+        assert other.acquire(blocking=False)
+        other.release()
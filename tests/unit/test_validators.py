@@ -2,89 +2,109 @@
 
 from pathlib import Path
 
+import pytest
+
 from ragkit.config import ConfigLoader
 from ragkit.config.validators import validate_config
 
 
-def _load_config(name: str = "ragkit-v1-config.yaml"):
-    loader = ConfigLoader()
-    return loader.load(Path(name))
-
-
-def test_valid_config_passes():
-    config = _load_config()
-    errors = validate_config(config)
-    # Errors about missing API keys are expected for a local config,
-    # but structural errors should not appear
-    structural = [e for e in errors if "path is required" in e or "at least one" in e.lower()]
-    assert structural == []
-
-
-def test_qdrant_local_missing_path():
-    config = _load_config()
-    config.vector_store.provider = "qdrant"
-    config.vector_store.qdrant.mode = "local"
-    config.vector_store.qdrant.path = None
-
-    errors = validate_config(config)
-    assert any("qdrant.path" in e for e in errors)
-
-
-def test_qdrant_cloud_missing_url():
-    config = _load_config()
-    config.vector_store.provider = "qdrant"
-    config.vector_store.qdrant.mode = "cloud"
-    config.vector_store.qdrant.url = None
-    config.vector_store.qdrant.url_env = None
+@pytest.fixture(scope="session")
+def base_config():
+    """ragkit-v1-config.yaml, read and validated once per session."""
+    return ConfigLoader().load(Path("ragkit-v1-config.yaml"))
 
-    errors = validate_config(config)
-    assert any("qdrant.url" in e for e in errors)
 
+@pytest.fixture
+def config(base_config):
+    """Private copy of the base config that a test may mutate."""
+    return base_config.model_copy(deep=True)
 
-def test_qdrant_cloud_invalid_url():
-    config = _load_config()
-    config.vector_store.provider = "qdrant"
-    config.vector_store.qdrant.mode = "cloud"
-    config.vector_store.qdrant.url = "not-a-url"
-    config.vector_store.qdrant.url_env = None
 
-    errors = validate_config(config)
-    assert any("valid URL" in e for e in errors)
+@pytest.fixture(scope="session")
+def baseline_errors(base_config):
+    """Errors the unmodified base config already reports."""
+    return set(validate_config(base_config))
 
 
-def test_chroma_persistent_missing_path():
-    config = _load_config()
-    config.vector_store.provider = "chroma"
-    config.vector_store.chroma.mode = "persistent"
-    config.vector_store.chroma.path = None
-
-    errors = validate_config(config)
-    assert any("chroma.path" in e for e in errors)
-
-
-def test_rerank_enabled_with_no_provider():
-    config = _load_config()
-    config.retrieval.rerank.enabled = True
-    config.retrieval.rerank.provider = "none"
-
-    errors = validate_config(config)
-    assert any("rerank.provider" in e for e in errors)
-
-
-def test_both_retrieval_modes_disabled():
-    config = _load_config()
-    config.retrieval.semantic.enabled = False
-    config.retrieval.lexical.enabled = False
-
-    errors = validate_config(config)
-    assert any("retrieval mode" in e.lower() for e in errors)
-
+def test_valid_config_passes(baseline_errors):
+    # Errors about missing API keys are expected for a local config,
+    # but structural errors should not appear
+    structural = [
+        e for e in baseline_errors if "path is required" in e or "at least one" in e.lower()
+    ]
+    assert structural == []
 
-def test_missing_llm_api_key_flagged():
-    config = _load_config()
-    config.llm.primary.provider = "openai"
-    config.llm.primary.api_key = None
-    config.llm.primary.api_key_env = None
 
-    errors = validate_config(config)
-    assert any("llm.primary.api_key" in e for e in errors)
+@pytest.mark.parametrize(
+    ("overrides", "expected"),
+    [
+        pytest.param(
+            {
+                "vector_store.provider": "qdrant",
+                "vector_store.qdrant.mode": "local",
+                "vector_store.qdrant.path": None,
+            },
+            "qdrant.path",
+            id="qdrant_local_missing_path",
+        ),
+        pytest.param(
+            {
+                "vector_store.provider": "qdrant",
+                "vector_store.qdrant.mode": "cloud",
+                "vector_store.qdrant.url": None,
+                "vector_store.qdrant.url_env": None,
+            },
+            "qdrant.url",
+            id="qdrant_cloud_missing_url",
+        ),
+        pytest.param(
+            {
+                "vector_store.provider": "qdrant",
+                "vector_store.qdrant.mode": "cloud",
+                "vector_store.qdrant.url": "not-a-url",
+                "vector_store.qdrant.url_env": None,
+            },
+            "valid URL",
+            id="qdrant_cloud_invalid_url",
+        ),
+        pytest.param(
+            {
+                "vector_store.provider": "chroma",
+                "vector_store.chroma.mode": "persistent",
+                "vector_store.chroma.path": None,
+            },
+            "chroma.path",
+            id="chroma_persistent_missing_path",
+        ),
+        pytest.param(
+            {"retrieval.rerank.enabled": True, "retrieval.rerank.provider": "none"},
+            "rerank.provider",
+            id="rerank_enabled_with_no_provider",
+        ),
+        pytest.param(
+            {"retrieval.semantic.enabled": False, "retrieval.lexical.enabled": False},
+            "retrieval mode",
+            id="both_retrieval_modes_disabled",
+        ),
+        pytest.param(
+            {
+                "llm.primary.provider": "openai",
+                "llm.primary.api_key": None,
+                "llm.primary.api_key_env": None,
+            },
+            "llm.primary.api_key",
+            id="missing_llm_api_key",
+        ),
+    ],
+)
+def test_invalid_config_reported(config, baseline_errors, overrides, expected):
+    for path, value in overrides.items():
+        *parents, field = path.split(".")
+        target = config
+        for name in parents:
+            target = getattr(target, name)
+        setattr(target, field, value)
+
+    # Only errors caused by the overrides count
+    new_errors = set(validate_config(config)) - baseline_errors
+    assert any(expected in e for e in new_errors)